@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import random
+import threading
 import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-from google.ads.googleads.client import GoogleAdsClient
+from google.api_core.exceptions import DeadlineExceeded, InternalServerError, ResourceExhausted, ServiceUnavailable
+from google.auth.exceptions import TransportError
 
 from .config import GoogleAdsConfig, load_config
 from .exceptions import AuthenticationError
 
+if TYPE_CHECKING:
+    from google.ads.googleads.client import GoogleAdsClient
+
 logger = logging.getLogger(__name__)
 
 _client: GoogleAdsClient | None = None
@@ -17,25 +26,100 @@ _config: GoogleAdsConfig | None = None
 
 _MAX_RETRIES = 3
 _RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 30.0
+# Transient failures worth retrying; anything else (bad credentials, revoked
+# refresh token, invalid config) fails immediately.
+_RETRYABLE_EXCEPTIONS = (
+    ServiceUnavailable,
+    DeadlineExceeded,
+    InternalServerError,
+    ResourceExhausted,
+    TransportError,
+)
+
+_CIRCUIT_FAILURE_THRESHOLD = 5
+_CIRCUIT_RESET_TIMEOUT = 30.0
+
+
+@dataclass
+class _CircuitBreaker:
+    """Fail fast after repeated client initialization failures.
+
+    CLOSED -> OPEN after ``_CIRCUIT_FAILURE_THRESHOLD`` consecutive failures.
+    OPEN -> HALF_OPEN once ``_CIRCUIT_RESET_TIMEOUT`` seconds have passed,
+    letting a single probe through; a failed probe reopens the circuit.
+    """
+
+    failures: int = 0
+    opened_at: float = 0.0
+    state: str = "CLOSED"
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def before_call(self) -> None:
+        """Raise AuthenticationError while the circuit is open."""
+        with self.lock:
+            if self.state != "OPEN":
+                return
+            remaining = _CIRCUIT_RESET_TIMEOUT - (time.monotonic() - self.opened_at)
+            if remaining > 0:
+                raise AuthenticationError(
+                    f"Google Ads client unavailable (circuit open). Retry in {remaining:.0f}s."
+                )
+            self.state = "HALF_OPEN"
+
+    def record_success(self) -> None:
+        with self.lock:
+            self.failures = 0
+            self.state = "CLOSED"
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.failures += 1
+            if self.state == "HALF_OPEN" or self.failures >= _CIRCUIT_FAILURE_THRESHOLD:
+                self.state = "OPEN"
+                self.opened_at = time.monotonic()
+                logger.error("Circuit breaker opened after %d consecutive failures", self.failures)
+
+
+_breaker = _CircuitBreaker()
+# Reentrant: get_client() resolves the config while holding it
+_init_lock = threading.RLock()
 
 
 def get_config() -> GoogleAdsConfig:
     """Get or create the config singleton."""
     global _config
-    if _config is None:
-        _config = load_config()
-    return _config
+    if _config is not None:
+        return _config
+    with _init_lock:
+        if _config is None:
+            _config = load_config()
+        return _config
 
 
 def get_client() -> GoogleAdsClient:
     """Get or create the GoogleAdsClient singleton using OAuth2 credentials."""
-    global _client
     if _client is not None:
         return _client
+    # Double-checked so concurrent first calls don't each run the OAuth2 refresh
+    with _init_lock:
+        if _client is not None:
+            return _client
+        return _init_client()
+
 
+def _init_client() -> GoogleAdsClient:
+    """Build the client with retries. Caller must hold ``_init_lock``."""
+    global _client
+    _breaker.before_call()
     config = get_config()
     last_error = None
 
+    # Deferred: importing google.ads.googleads pulls in the whole v23 proto tree
+    from google.ads.googleads.client import GoogleAdsClient
+
+    _warn_if_pure_python_protobuf()
+
     for attempt in range(_MAX_RETRIES):
         try:
             _client = GoogleAdsClient.load_from_dict(
@@ -48,28 +132,107 @@ def get_client() -> GoogleAdsClient:
                     "use_proto_plus": True,
                 }
             )
+            _memoize_get_type(_client)
+            _client.enums = _CachedEnums(_client.enums)
             logger.info("Google Ads client initialized (MCC: %s)", config.login_customer_id)
+            _breaker.record_success()
             return _client
-        except Exception as e:
+        except _RETRYABLE_EXCEPTIONS as e:
             last_error = e
             if attempt < _MAX_RETRIES - 1:
-                delay = _RETRY_BASE_DELAY * (2 ** attempt)
+                # Full jitter: spread retries over the whole backoff window
+                delay = random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * (2 ** attempt)))
                 logger.warning(
                     "Failed to initialize Google Ads client (attempt %d/%d): %s. Retrying in %.1fs...",
                     attempt + 1, _MAX_RETRIES, e, delay,
                 )
                 time.sleep(delay)
+        except Exception as e:
+            _breaker.record_failure()
+            raise AuthenticationError(f"Failed to initialize Google Ads client: {e}") from e
 
+    _breaker.record_failure()
     raise AuthenticationError(f"Failed to initialize Google Ads client after {_MAX_RETRIES} attempts: {last_error}") from last_error
 
 
-def get_service(service_name: str):
-    """Get a Google Ads API service by name."""
+def _warn_if_pure_python_protobuf() -> None:
+    """Log when protobuf runs on its pure-Python backend (an order of magnitude slower to decode)."""
+    from google.protobuf.internal import api_implementation
+
+    if api_implementation.Type() == "python":
+        logger.warning(
+            "protobuf is using the pure-Python backend; large reports will decode slowly. "
+            "Unset PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION or install a protobuf wheel for this platform."
+        )
+
+
+def _memoize_get_type(client: GoogleAdsClient) -> None:
+    """Resolve each message class once; later ``get_type`` calls just instantiate it.
+
+    ``GoogleAdsClient.get_type`` walks several lazily loaded namespaces on every
+    call (~0.5ms), which adds up in loops that build thousands of operations.
+    Callers still get a fresh, empty message each time.
+    """
+    resolve = client.get_type
+    classes: dict[tuple[str, str | None], type] = {}
+
+    @functools.wraps(resolve)
+    def get_type(name: str, version: str | None = None):
+        cls = classes.get((name, version))
+        if cls is not None:
+            return cls()
+        message = resolve(name) if version is None else resolve(name, version)
+        classes[(name, version)] = type(message)
+        return message
+
+    client.get_type = get_type
+
+
+class _CachedEnums:
+    """Caches enum classes looked up through ``client.enums``.
+
+    The library's enum getter scans the full enum list and re-resolves the class
+    on every attribute access (~20us), so ``client.enums.AdGroupStatusEnum.PAUSED``
+    in a tool pays that each call. The first lookup is stored on the instance,
+    after which normal attribute access finds it without reaching ``__getattr__``.
+    """
+
+    def __init__(self, enums) -> None:
+        self._enums = enums
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        value = getattr(self._enums, name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return dir(self._enums)
+
+
+@functools.lru_cache(maxsize=64)
+def _get_service_cached(service_name: str):
     return get_client().get_service(service_name)
 
 
+def get_service(service_name: str):
+    """Get a Google Ads API service by name.
+
+    Service clients are stateless stubs over the shared credentials, so one
+    instance per name is built and reused (``client.get_service`` opens a new
+    gRPC channel on every call). OAuth2 token refreshes happen inside the
+    credentials and need no invalidation; after changing credentials or
+    config, call ``reset_client()``, which also drops these cached services.
+    """
+    return _get_service_cached(service_name)
+
+
 def reset_client() -> None:
-    """Reset client singleton (for testing)."""
+    """Reset the client singleton, config and cached services (tests, credential changes)."""
     global _client, _config
     _client = None
     _config = None
+    load_config.cache_clear()
+    _get_service_cached.cache_clear()
+    _breaker.record_success()
@@ -2,24 +2,34 @@
 
 from __future__ import annotations
 
+import functools
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 
 @dataclass(frozen=True)
 class GoogleAdsConfig:
     """Configuration loaded from environment variables."""
 
-    client_id: str = field(default_factory=lambda: os.environ.get("GOOGLE_ADS_CLIENT_ID", ""))
-    client_secret: str = field(default_factory=lambda: os.environ.get("GOOGLE_ADS_CLIENT_SECRET", ""))
-    developer_token: str = field(default_factory=lambda: os.environ.get("GOOGLE_ADS_DEVELOPER_TOKEN", ""))
-    refresh_token: str = field(default_factory=lambda: os.environ.get("GOOGLE_ADS_REFRESH_TOKEN", ""))
-    login_customer_id: str = field(
-        default_factory=lambda: os.environ.get("GOOGLE_ADS_LOGIN_CUSTOMER_ID", "")
-    )
-    default_customer_id: str = field(
-        default_factory=lambda: os.environ.get("GOOGLE_ADS_CUSTOMER_ID", "")
-    )
+    client_id: str
+    client_secret: str
+    developer_token: str
+    refresh_token: str
+    login_customer_id: str
+    default_customer_id: str = ""
+
+    @classmethod
+    def from_env(cls) -> GoogleAdsConfig:
+        """Build a config from a single pass over ``os.environ``."""
+        env = os.environ
+        return cls(
+            client_id=env.get("GOOGLE_ADS_CLIENT_ID", ""),
+            client_secret=env.get("GOOGLE_ADS_CLIENT_SECRET", ""),
+            developer_token=env.get("GOOGLE_ADS_DEVELOPER_TOKEN", ""),
+            refresh_token=env.get("GOOGLE_ADS_REFRESH_TOKEN", ""),
+            login_customer_id=env.get("GOOGLE_ADS_LOGIN_CUSTOMER_ID", ""),
+            default_customer_id=env.get("GOOGLE_ADS_CUSTOMER_ID", ""),
+        )
 
     def validate(self) -> list[str]:
         """Return list of missing required fields."""
@@ -33,9 +43,14 @@ class GoogleAdsConfig:
         return [k for k, v in required.items() if not v]
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> GoogleAdsConfig:
-    """Load and validate configuration from environment."""
-    config = GoogleAdsConfig()
+    """Load and validate configuration from environment.
+
+    Cached for the lifetime of the process; call ``load_config.cache_clear()``
+    to force a re-read (failures are never cached).
+    """
+    config = GoogleAdsConfig.from_env()
     missing = config.validate()
     if missing:
         raise OSError(
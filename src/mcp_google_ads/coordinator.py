@@ -2,50 +2,22 @@
 
 from __future__ import annotations
 
+import functools
+from importlib import resources
+
 from mcp.server.fastmcp import FastMCP
 
 mcp = FastMCP(
     "google-ads",
-    instructions="""MCP Server for Google Ads API v23 — 242 tools for full CRUD operations.
+    instructions="""MCP Server for Google Ads API v23 — 245 tools for full CRUD operations.
 
 ## Account Structure
 This server connects to an MCC (Manager) account that manages multiple client accounts.
 Always start by listing accessible customers, then select a specific client account (customer_id) for operations.
 
-## Tool Categories (242 tools across 33 modules)
-- **Accounts (4):** list_accessible_customers, get_customer_info, get_account_hierarchy, list_customer_clients
-- **Account Management (3):** list_account_links, get_billing_info, list_account_users
-- **Campaigns (9):** list, get, create, update, set_status, remove, list_labels, set_tracking_template, clone_campaign
-- **Campaign Types (17):** create_pmax, create_display, create_video, create_shopping, create_demand_gen, create_app, get/create/list/update/remove asset_groups, add/remove/list asset_group_assets, create/list/remove listing_group_filters
-- **Ad Groups (7):** list, get, create, update, set_status, remove, clone_ad_group
-- **Ads (7):** list, get, create_rsa, create_responsive_display_ad, update, set_status, get_strength
-- **Keywords (15):** list, add, update, remove, bulk_update, neg_campaign, neg_ad_group, neg_shared, pmax_neg, generate_ideas, forecast, list_negative, add/list/remove_account_negative
-- **Budgets (5):** list, get, create, update, remove
-- **Bidding (12):** list, get, create, update, set_campaign_strategy, list/create/remove_bidding_data_exclusion, list/create/remove_seasonality_adjustment, list_accessible_bidding_strategies
-- **Reporting (26):** campaign/adgroup/ad/keyword perf, search_terms, audience, geo, change_history, change_event, device, hourly, age_gender, placement, quality_score, comparison, pmax_search_term_insights, pmax_network_breakdown, auction_insights, landing_page, asset_performance, shopping_performance, get_industry_benchmarks, reach_frequency, video_frequency, per_store_view, keyword_view
-- **Dashboard (2):** mcc_performance_summary, account_dashboard
-- **Audiences (15):** list_segments, add/remove targeting, suggest_geo, list_targeting, add/remove_audience_ad_group, create/list/update/remove_custom_audience, add_audience/search_theme_signal, list/remove_asset_group_signals
-- **Extensions (15):** list_assets, sitelinks, callouts, snippets, call, remove, image, video, lead_form, price, promotion, link_campaign, link_ad_group, unlink, unlink_customer_assets
-- **Labels (8):** list, create, remove, apply_to_campaign/ad_group/ad/keyword, remove_from_resource
-- **Shared Sets (6):** list, create, remove, list_members, link/unlink_to_campaign
-- **Conversions (9):** list_actions, get_action, create_action, update_action, import_offline, list_goals, update_goal, list/update_campaign_conversion_goals
-- **Targeting (18):** device_bid, list_device_bid_adjustments, create/list/remove/update ad_schedule, exclude_geo, add_geo, list_geo_targeting, add/remove/list_language_targeting, age/gender/income bid, demographic_batch, add/list proximity_targeting
-- **Recommendations (5):** list, get, apply, dismiss, get_optimization_score
-- **Experiments (5):** list, create, get, promote, end
-- **Batch (1):** batch_set_status (multi-resource status changes in one call)
-- **Diagnostics (3):** campaign_health_check, validate_landing_page, budget_forecast
-- **AI Generation (3):** generate_ad_text, generate_ad_images, generate_audience_definition
-- **Incentives (2):** fetch_incentive, apply_incentive
-- **YouTube Uploads (3):** create_youtube_video_upload, update_youtube_video_upload, remove_youtube_video_upload
-- **GAQL (1):** execute_gaql (raw SELECT-only queries)
-- **Simulations (6):** list_campaign/ad_group/keyword_simulations, get_bid_simulation_points, list_campaign_budget_simulations, get_keyword_plan_simulation
-- **Campaign Drafts (5):** list, get, create, promote, remove
-- **Ad Customizers (5):** list/create/remove_customizer_attributes, set_campaign/ad_group_customizer_value
-- **User Lists (6):** list, get, create_crm, add/remove_members, update
-- **Campaign Criteria (5):** list, add, remove, exclude_ip_addresses, list_ip_exclusions
-- **Account Budget (5):** list_budgets, get_budget, list/create/remove_proposals
-- **Remarketing (5):** list/get/create/remove_remarketing_actions, list_combined_audiences
-- **Smart Campaigns (4):** suggest_budget, suggest_ad, suggest_keyword_themes, list_settings
+## Tools
+245 tools across 33 modules (accounts, campaigns, ad groups, ads, keywords, budgets, bidding, reporting, audiences, extensions, conversions, targeting, ...).
+The full per-module catalog is available on demand as the `google-ads://tool-catalog` resource.
 
 ## Typical Workflow
 1. `list_accessible_customers` → discover the MCC account
@@ -68,3 +40,20 @@ All 26 reporting tools support custom date ranges via `start_date`/`end_date` (Y
 Monetary values are in micros (1 BRL = 1,000,000 micros). The response includes both raw micros and converted values for convenience.
 """,
 )
+
+
+@functools.lru_cache(maxsize=1)
+def load_tool_catalog() -> str:
+    """Read the full tool catalog shipped with the package (loaded on first use)."""
+    return resources.files(__package__).joinpath("resources/tool_catalog.md").read_text(encoding="utf-8")
+
+
+@mcp.resource(
+    "google-ads://tool-catalog",
+    name="tool_catalog",
+    description="Full catalog of Google Ads tools grouped by module",
+    mime_type="text/markdown",
+)
+def tool_catalog() -> str:
+    """Serve the tool catalog kept out of the session instructions."""
+    return load_tool_catalog()
@@ -2,25 +2,37 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Mapping
+from types import MappingProxyType
+
 
 class GoogleAdsMCPError(Exception):
     """Base exception for Google Ads MCP errors."""
 
+    __slots__ = ()
+
 
 class AuthenticationError(GoogleAdsMCPError):
     """Raised when authentication fails."""
 
+    __slots__ = ()
+
 
 class RateLimitError(GoogleAdsMCPError):
     """Raised when API rate limit is hit."""
 
+    __slots__ = ()
+
 
 class QuotaExhaustedError(GoogleAdsMCPError):
     """Raised when daily API quota is exhausted."""
 
+    __slots__ = ()
 
-# Common Google Ads API error codes → friendly messages (Portuguese)
-FRIENDLY_ERROR_MESSAGES: dict[str, str] = {
+
+# Common Google Ads API error codes → friendly messages (Portuguese); read-only, keys already uppercase
+FRIENDLY_ERROR_MESSAGES: Mapping[str, str] = MappingProxyType({
     "AUTHENTICATION_ERROR": "Erro de autenticação. Verifique as credenciais OAuth2 e o refresh token.",
     "AUTHORIZATION_ERROR": "Sem permissão para acessar esta conta. Verifique se o MCC tem acesso.",
     "QUOTA_ERROR": "Cota da API excedida. Aguarde alguns minutos antes de tentar novamente.",
@@ -39,7 +51,13 @@ FRIENDLY_ERROR_MESSAGES: dict[str, str] = {
     "DISTINCT_ERROR": "Itens duplicados detectados na mesma operação.",
     "NOT_ALLOWLISTED": "Operação não permitida para esta conta. Pode exigir allowlisting pelo Google.",
     "CUSTOMER_NOT_ACTIVE": "A conta está suspensa ou inativa. Verifique o status no Google Ads.",
-}
+})
+
+
+# Single-pass matcher over all known codes; rank keeps dict order as the tie-breaker
+_FRIENDLY_KEYS = tuple(FRIENDLY_ERROR_MESSAGES)
+_FRIENDLY_ERROR_RANK = {key: i for i, key in enumerate(_FRIENDLY_KEYS)}
+_FRIENDLY_ERROR_PATTERN = re.compile("|".join(re.escape(key) for key in _FRIENDLY_KEYS))
 
 
 def get_friendly_error(error_code: str, original_message: str = "") -> str:
@@ -47,7 +65,9 @@ def get_friendly_error(error_code: str, original_message: str = "") -> str:
 
     Returns the friendly message if available, otherwise the original message.
     """
-    for key, friendly in FRIENDLY_ERROR_MESSAGES.items():
-        if key in error_code.upper() or key in original_message.upper():
-            return f"{friendly} (Original: {original_message})" if original_message else friendly
+    haystack = f"{error_code}\n{original_message}".upper()
+    matches = {m.group(0) for m in _FRIENDLY_ERROR_PATTERN.finditer(haystack)}
+    if matches:
+        friendly = FRIENDLY_ERROR_MESSAGES[min(matches, key=_FRIENDLY_ERROR_RANK.__getitem__)]
+        return f"{friendly} (Original: {original_message})" if original_message else friendly
     return original_message or error_code
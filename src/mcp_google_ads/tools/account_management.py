@@ -7,7 +7,14 @@ from typing import Annotated
 
 from ..auth import get_service
 from ..coordinator import mcp
-from ..utils import error_response, resolve_customer_id, success_response, validate_limit
+from ..utils import (
+    enum_name,
+    error_response,
+    resolve_customer_id,
+    search_stream_rows,
+    success_response,
+    validate_limit,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,13 +41,13 @@ def list_account_links(
             FROM account_link
             LIMIT {limit}
         """
-        response = service.search(customer_id=cid, query=query)
         links = []
-        for row in response:
+        for row in search_stream_rows(service, cid, query):
+            link = row.account_link
             links.append({
-                "account_link_id": str(row.account_link.account_link_id),
-                "status": row.account_link.status.name,
-                "resource_name": row.account_link.resource_name,
+                "account_link_id": str(link.account_link_id),
+                "status": enum_name(link, "status"),
+                "resource_name": link.resource_name,
             })
         return success_response({"account_links": links, "count": len(links)})
     except Exception as e:
@@ -114,15 +121,15 @@ def list_account_users(
             FROM customer_user_access
             LIMIT {limit}
         """
-        response = service.search(customer_id=cid, query=query)
         users = []
-        for row in response:
+        for row in search_stream_rows(service, cid, query):
+            access = row.customer_user_access
             users.append({
-                "user_id": str(row.customer_user_access.user_id),
-                "email": row.customer_user_access.email_address,
-                "access_role": row.customer_user_access.access_role.name,
-                "access_created": row.customer_user_access.access_creation_date_time,
-                "inviter_email": row.customer_user_access.inviter_user_email_address,
+                "user_id": str(access.user_id),
+                "email": access.email_address,
+                "access_role": enum_name(access, "access_role"),
+                "access_created": access.access_creation_date_time,
+                "inviter_email": access.inviter_user_email_address,
             })
         return success_response({"users": users, "count": len(users)})
     except Exception as e:
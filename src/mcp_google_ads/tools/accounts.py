@@ -1,16 +1,42 @@
-"""Account management tools (4 tools)."""
+"""Account management tools (5 tools)."""
 
 from __future__ import annotations
 
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated
 
 from ..auth import get_service
 from ..coordinator import mcp
-from ..utils import error_response, resolve_customer_id, success_response
+from ..utils import (
+    enum_name,
+    error_response,
+    resolve_customer_id,
+    search_stream_rows,
+    select_fields,
+    success_response,
+)
 
 logger = logging.getLogger(__name__)
 
+_HIERARCHY_FIELDS = {
+    "customer_id": "customer_client.id",
+    "name": "customer_client.descriptive_name",
+    "level": "customer_client.level",
+    "is_manager": "customer_client.manager",
+    "status": "customer_client.status",
+    "currency": "customer_client.currency_code",
+    "timezone": "customer_client.time_zone",
+}
+
+_CUSTOMER_CLIENT_FIELDS = {
+    "customer_id": "customer_client.id",
+    "name": "customer_client.descriptive_name",
+    "status": "customer_client.status",
+    "currency": "customer_client.currency_code",
+}
+
 
 @mcp.tool()
 def list_accessible_customers() -> str:
@@ -80,6 +106,7 @@ def get_customer_info(
 @mcp.tool()
 def get_account_hierarchy(
     customer_id: Annotated[str | None, "MCC customer ID. Uses login_customer_id if not provided."] = None,
+    fields: Annotated[list[str] | None, "Only return these keys (e.g. ['customer_id', 'name']). Default: all"] = None,
 ) -> str:
     """Get the full account hierarchy under an MCC (Manager) account.
 
@@ -87,42 +114,121 @@ def get_account_hierarchy(
     """
     try:
         cid = resolve_customer_id(customer_id)
+        keys, select = select_fields(
+            fields, _HIERARCHY_FIELDS,
+            required=("customer_client.id", "customer_client.level", "customer_client.descriptive_name"),
+        )
         service = get_service("GoogleAdsService")
-        query = """
-            SELECT
-                customer_client.client_customer,
-                customer_client.id,
-                customer_client.descriptive_name,
-                customer_client.level,
-                customer_client.manager,
-                customer_client.status,
-                customer_client.currency_code,
-                customer_client.time_zone
+        query = f"""
+            SELECT {select}
             FROM customer_client
             WHERE customer_client.level <= 1
             ORDER BY customer_client.level ASC, customer_client.descriptive_name ASC
         """
-        response = service.search(customer_id=cid, query=query)
         accounts = []
-        for row in response:
-            accounts.append({
-                "customer_id": str(row.customer_client.id),
-                "name": row.customer_client.descriptive_name,
-                "level": row.customer_client.level,
-                "is_manager": row.customer_client.manager,
-                "status": row.customer_client.status.name,
-                "currency": row.customer_client.currency_code,
-                "timezone": row.customer_client.time_zone,
-            })
+        for row in search_stream_rows(service, cid, query):
+            client = row.customer_client
+            account = {
+                "customer_id": str(client.id),
+                "name": client.descriptive_name,
+                "level": client.level,
+                "is_manager": client.manager,
+                "status": enum_name(client, "status"),
+                "currency": client.currency_code,
+                "timezone": client.time_zone,
+            }
+            accounts.append({key: account[key] for key in keys} if fields else account)
         return success_response({"accounts": accounts, "count": len(accounts)})
     except Exception as e:
         logger.error("Failed to get account hierarchy: %s", e, exc_info=True)
         return error_response(f"Failed to get account hierarchy: {e}")
 
 
+_HIERARCHY_MAX_WORKERS = 8
+
+_DIRECT_CHILDREN_QUERY = """
+    SELECT
+        customer_client.id,
+        customer_client.descriptive_name,
+        customer_client.manager,
+        customer_client.status,
+        customer_client.currency_code,
+        customer_client.time_zone
+    FROM customer_client
+    WHERE customer_client.level = 1
+    ORDER BY customer_client.descriptive_name ASC
+"""
+
+
+def _fetch_direct_children(service, manager_id: str) -> list[dict]:
+    """Return the level-1 clients of a single manager account."""
+    children = []
+    for row in search_stream_rows(service, manager_id, _DIRECT_CHILDREN_QUERY):
+        client = row.customer_client
+        children.append({
+            "customer_id": str(client.id),
+            "name": client.descriptive_name,
+            "parent_id": manager_id,
+            "is_manager": client.manager,
+            "status": enum_name(client, "status"),
+            "currency": client.currency_code,
+            "timezone": client.time_zone,
+        })
+    return children
+
+
+@mcp.tool()
+def get_account_hierarchy_recursive(
+    customer_id: Annotated[str | None, "MCC customer ID. Uses login_customer_id if not provided."] = None,
+    max_depth: Annotated[int, "Maximum depth to walk below the MCC (1-10)"] = 3,
+) -> str:
+    """Walk the account tree below an MCC, descending into nested manager accounts.
+
+    Each level's sub-managers are queried concurrently, so deep MCC trees cost one
+    round trip per level instead of one per manager. Every account includes its
+    depth and parent_id. ``truncated`` is true when max_depth stopped the walk
+    before manager accounts at the last level were expanded, so their children
+    (if any) are not listed; raise max_depth to see them.
+    """
+    try:
+        cid = resolve_customer_id(customer_id)
+        if not 1 <= max_depth <= 10:
+            return error_response(f"max_depth deve ser entre 1 e 10, recebido: {max_depth}")
+        service = get_service("GoogleAdsService")
+
+        accounts = []
+        visited = {cid}
+        frontier = [cid]
+        with ThreadPoolExecutor(max_workers=_HIERARCHY_MAX_WORKERS) as executor:
+            for depth in range(1, max_depth + 1):
+                if not frontier:
+                    break
+                results = executor.map(functools.partial(_fetch_direct_children, service), frontier)
+                frontier = []
+                for children in results:
+                    for child in children:
+                        if child["customer_id"] in visited:
+                            continue
+                        visited.add(child["customer_id"])
+                        child["depth"] = depth
+                        accounts.append(child)
+                        if child["is_manager"]:
+                            frontier.append(child["customer_id"])
+
+        return success_response({
+            "accounts": accounts,
+            "count": len(accounts),
+            "truncated": bool(frontier),
+        })
+    except Exception as e:
+        logger.error("Failed to get recursive account hierarchy: %s", e, exc_info=True)
+        return error_response(f"Failed to get recursive account hierarchy: {e}")
+
+
 @mcp.tool()
 def list_customer_clients(
     customer_id: Annotated[str | None, "MCC customer ID. Uses login_customer_id if not provided."] = None,
+    fields: Annotated[list[str] | None, "Only return these keys (e.g. ['customer_id', 'name']). Default: all"] = None,
 ) -> str:
     """List all client accounts under an MCC with basic info and spend status.
 
@@ -130,27 +236,27 @@ def list_customer_clients(
     """
     try:
         cid = resolve_customer_id(customer_id)
+        keys, select = select_fields(
+            fields, _CUSTOMER_CLIENT_FIELDS,
+            required=("customer_client.id", "customer_client.descriptive_name"),
+        )
         service = get_service("GoogleAdsService")
-        query = """
-            SELECT
-                customer_client.id,
-                customer_client.descriptive_name,
-                customer_client.manager,
-                customer_client.status,
-                customer_client.currency_code
+        query = f"""
+            SELECT {select}
             FROM customer_client
             WHERE customer_client.manager = false
             ORDER BY customer_client.descriptive_name ASC
         """
-        response = service.search(customer_id=cid, query=query)
         clients = []
-        for row in response:
-            clients.append({
-                "customer_id": str(row.customer_client.id),
-                "name": row.customer_client.descriptive_name,
-                "status": row.customer_client.status.name,
-                "currency": row.customer_client.currency_code,
-            })
+        for row in search_stream_rows(service, cid, query):
+            client = row.customer_client
+            entry = {
+                "customer_id": str(client.id),
+                "name": client.descriptive_name,
+                "status": enum_name(client, "status"),
+                "currency": client.currency_code,
+            }
+            clients.append({key: entry[key] for key in keys} if fields else entry)
         return success_response({"clients": clients, "count": len(clients)})
     except Exception as e:
         logger.error("Failed to list customer clients: %s", e, exc_info=True)
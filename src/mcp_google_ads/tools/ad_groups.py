@@ -1,8 +1,9 @@
-"""Ad Group management tools (7 tools)."""
+"""Ad Group management tools (8 tools)."""
 
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated
 
 from google.api_core import protobuf_helpers
@@ -10,11 +11,15 @@ from google.api_core import protobuf_helpers
 from ..auth import get_client, get_service
 from ..coordinator import mcp
 from ..utils import (
+    enum_name,
     error_response,
     format_micros,
     resolve_customer_id,
+    search_stream_rows,
+    select_fields,
     success_response,
     to_micros,
+    validate_batch,
     validate_enum_value,
     validate_limit,
     validate_numeric_id,
@@ -23,6 +28,17 @@ from ..utils import (
 
 logger = logging.getLogger(__name__)
 
+_AD_GROUP_FIELDS = {
+    "ad_group_id": "ad_group.id",
+    "name": "ad_group.name",
+    "status": "ad_group.status",
+    "type": "ad_group.type",
+    "cpc_bid_micros": "ad_group.cpc_bid_micros",
+    "cpc_bid": "ad_group.cpc_bid_micros",
+    "campaign_id": "campaign.id",
+    "campaign_name": "campaign.name",
+}
+
 
 @mcp.tool()
 def list_ad_groups(
@@ -30,11 +46,16 @@ def list_ad_groups(
     campaign_id: Annotated[str | None, "Filter by campaign ID"] = None,
     status_filter: Annotated[str | None, "Filter: ENABLED, PAUSED, REMOVED"] = None,
     limit: Annotated[int, "Maximum results"] = 100,
+    fields: Annotated[list[str] | None, "Only return these keys (e.g. ['ad_group_id', 'name']). Default: all"] = None,
 ) -> str:
-    """List ad groups, optionally filtered by campaign and/or status."""
+    """List ad groups, optionally filtered by campaign and/or status.
+
+    Pass ``fields`` to narrow the GAQL SELECT when only a few columns are needed.
+    """
     try:
         cid = resolve_customer_id(customer_id)
         limit = validate_limit(limit)
+        keys, select = select_fields(fields, _AD_GROUP_FIELDS, required=("ad_group.id", "ad_group.name"))
         service = get_service("GoogleAdsService")
         conditions = []
         if campaign_id:
@@ -44,32 +65,26 @@ def list_ad_groups(
         where = "WHERE " + " AND ".join(conditions) if conditions else ""
 
         query = f"""
-            SELECT
-                ad_group.id,
-                ad_group.name,
-                ad_group.status,
-                ad_group.type,
-                ad_group.cpc_bid_micros,
-                campaign.id,
-                campaign.name
+            SELECT {select}
             FROM ad_group
             {where}
             ORDER BY ad_group.name ASC
             LIMIT {limit}
         """
-        response = service.search(customer_id=cid, query=query)
         groups = []
-        for row in response:
-            groups.append({
-                "ad_group_id": str(row.ad_group.id),
-                "name": row.ad_group.name,
-                "status": row.ad_group.status.name,
-                "type": row.ad_group.type_.name,
-                "cpc_bid_micros": row.ad_group.cpc_bid_micros,
-                "cpc_bid": format_micros(row.ad_group.cpc_bid_micros),
+        for row in search_stream_rows(service, cid, query):
+            ad_group = row.ad_group
+            group = {
+                "ad_group_id": str(ad_group.id),
+                "name": ad_group.name,
+                "status": enum_name(ad_group, "status"),
+                "type": enum_name(ad_group, "type_"),
+                "cpc_bid_micros": ad_group.cpc_bid_micros,
+                "cpc_bid": format_micros(ad_group.cpc_bid_micros),
                 "campaign_id": str(row.campaign.id),
                 "campaign_name": row.campaign.name,
-            })
+            }
+            groups.append({key: group[key] for key in keys} if fields else group)
         return success_response({"ad_groups": groups, "count": len(groups)})
     except Exception as e:
         logger.error("Failed to list ad groups: %s", e, exc_info=True)
@@ -93,10 +108,8 @@ def get_ad_group(
                 ad_group.status,
                 ad_group.type,
                 ad_group.cpc_bid_micros,
-                ad_group.cpm_bid_micros,
                 ad_group.target_cpa_micros,
                 ad_group.target_roas,
-                ad_group.effective_target_cpa_micros,
                 campaign.id,
                 campaign.name
             FROM ad_group
@@ -134,6 +147,12 @@ def create_ad_group(
     """Create a new ad group within a campaign. Created PAUSED by default."""
     try:
         cid = resolve_customer_id(customer_id)
+        validate_enum_value(ad_group_type, "ad_group_type")
+        if cpc_bid is not None and cpc_bid < 0.10:
+            return error_response(
+                f"CPC bid R${cpc_bid:.2f} is suspiciously low (< R$0.10). "
+                f"Pass the value in currency, not micros (e.g., 10.0 for R$10.00)."
+            )
         client = get_client()
         service = get_service("AdGroupService")
 
@@ -142,20 +161,13 @@ def create_ad_group(
         ad_group.name = name
         ad_group.status = client.enums.AdGroupStatusEnum.PAUSED
         ad_group.campaign = f"customers/{cid}/campaigns/{campaign_id}"
-        validate_enum_value(ad_group_type, "ad_group_type")
         ad_group.type_ = getattr(client.enums.AdGroupTypeEnum, ad_group_type)
-
         if cpc_bid is not None:
-            if cpc_bid < 0.10:
-                return error_response(
-                    f"CPC bid R${cpc_bid:.2f} is suspiciously low (< R$0.10). "
-                    f"Pass the value in currency, not micros (e.g., 10.0 for R$10.00)."
-                )
             ad_group.cpc_bid_micros = to_micros(cpc_bid)
 
         response = service.mutate_ad_groups(customer_id=cid, operations=[operation])
         resource_name = response.results[0].resource_name
-        new_id = resource_name.split("/")[-1]
+        new_id = resource_name.rpartition("/")[2]
 
         return success_response(
             {"ad_group_id": new_id, "resource_name": resource_name, "status": "PAUSED"},
@@ -177,6 +189,8 @@ def update_ad_group(
     """Update an ad group's name, bid, or target CPA."""
     try:
         cid = resolve_customer_id(customer_id)
+        if name is None and cpc_bid is None and target_cpa_micros is None:
+            return error_response("No fields to update")
         client = get_client()
         service = get_service("AdGroupService")
 
@@ -195,9 +209,6 @@ def update_ad_group(
             ad_group.target_cpa_micros = target_cpa_micros
             fields.append("target_cpa_micros")
 
-        if not fields:
-            return error_response("No fields to update")
-
         client.copy_from(
             operation.update_mask,
             protobuf_helpers.field_mask_pb2.FieldMask(paths=fields),
@@ -222,13 +233,13 @@ def set_ad_group_status(
     """Enable, pause, or remove an ad group."""
     try:
         cid = resolve_customer_id(customer_id)
+        validate_enum_value(status, "status")
         client = get_client()
         service = get_service("AdGroupService")
 
         operation = client.get_type("AdGroupOperation")
         ad_group = operation.update
         ad_group.resource_name = f"customers/{cid}/adGroups/{ad_group_id}"
-        validate_enum_value(status, "status")
         ad_group.status = getattr(client.enums.AdGroupStatusEnum, status)
 
         client.copy_from(
@@ -270,6 +281,67 @@ def remove_ad_group(
         return error_response(f"Failed to remove ad group: {e}")
 
 
+@mcp.tool()
+def remove_ad_groups(
+    customer_id: Annotated[str, "The Google Ads customer ID"],
+    ad_group_ids: Annotated[list[str], "List of ad group IDs to remove (max 5000)"],
+) -> str:
+    """Remove (delete) multiple ad groups permanently in a single API call.
+
+    For pausing/enabling several ad groups at once use batch_set_status.
+    """
+    try:
+        cid = resolve_customer_id(customer_id)
+
+        if not ad_group_ids:
+            return error_response("ad_group_ids cannot be empty")
+        error = validate_batch(ad_group_ids, max_size=5000, item_name="ad_group_ids")
+        if error:
+            return error_response(error)
+        safe_ids = [validate_numeric_id(ad_group_id, "ad_group_id") for ad_group_id in ad_group_ids]
+
+        client = get_client()
+        service = get_service("AdGroupService")
+
+        prefix = f"customers/{cid}/adGroups/"
+        operations = []
+        for safe_id in safe_ids:
+            operation = client.get_type("AdGroupOperation")
+            operation.remove = prefix + safe_id
+            operations.append(operation)
+
+        response = service.mutate_ad_groups(customer_id=cid, operations=operations)
+        removed = [r.resource_name for r in response.results]
+        return success_response(
+            {"removed": len(removed), "resource_names": removed},
+            message=f"{len(removed)} ad groups removed",
+        )
+    except Exception as e:
+        logger.error("Failed to remove ad groups: %s", e, exc_info=True)
+        return error_response(f"Failed to remove ad groups: {e}")
+
+
+def _fetch_source_keywords(search_service, cid: str, ad_group_id: str, negative: bool) -> list[tuple[str, int, int]]:
+    """Read (text, match_type, cpc_bid_micros) for an ad group's active keywords or negatives."""
+    query = f"""
+        SELECT
+            ad_group_criterion.keyword.text,
+            ad_group_criterion.keyword.match_type,
+            ad_group_criterion.cpc_bid_micros
+        FROM ad_group_criterion
+        WHERE ad_group.id = {ad_group_id}
+            AND ad_group_criterion.type = 'KEYWORD'
+            AND ad_group_criterion.negative = {"true" if negative else "false"}
+            AND ad_group_criterion.status != 'REMOVED'
+        LIMIT 5000
+    """
+    keywords = []
+    for row in search_stream_rows(search_service, cid, query):
+        criterion = row.ad_group_criterion
+        keywords.append((criterion.keyword.text, criterion.keyword.match_type, criterion.cpc_bid_micros))
+    return keywords
+
+
 @mcp.tool()
 def clone_ad_group(
     customer_id: Annotated[str, "The Google Ads customer ID"],
@@ -296,100 +368,75 @@ def clone_ad_group(
                 ad_group.name,
                 ad_group.type,
                 ad_group.cpc_bid_micros,
-                ad_group.target_cpa_micros,
                 campaign.id
             FROM ad_group
             WHERE ad_group.id = {safe_source}
         """
-        response = search_service.search(customer_id=cid, query=query)
-        source = None
-        for row in response:
-            source = row
+        source = next(iter(search_service.search(customer_id=cid, query=query)), None)
         if source is None:
             return error_response(f"Source ad group {source_ad_group_id} not found")
 
         campaign_id = target_campaign_id or str(source.campaign.id)
         clone_name = new_name or f"{source.ad_group.name} [Clone]"
 
-        # 2. Create the new ad group
-        ag_service = get_service("AdGroupService")
-        ag_op = client.get_type("AdGroupOperation")
-        new_ag = ag_op.create
-        new_ag.name = clone_name
-        new_ag.status = client.enums.AdGroupStatusEnum.PAUSED
-        new_ag.campaign = f"customers/{cid}/campaigns/{campaign_id}"
-        new_ag.type_ = source.ad_group.type_
-        if source.ad_group.cpc_bid_micros:
-            new_ag.cpc_bid_micros = source.ad_group.cpc_bid_micros
-
-        ag_response = ag_service.mutate_ad_groups(customer_id=cid, operations=[ag_op])
-        new_ag_resource = ag_response.results[0].resource_name
-        new_ag_id = new_ag_resource.split("/")[-1]
+        # 2. Read source keywords/negatives in the background while the clone is created
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            kw_future = (
+                executor.submit(_fetch_source_keywords, search_service, cid, safe_source, negative=False)
+                if copy_keywords else None
+            )
+            neg_future = (
+                executor.submit(_fetch_source_keywords, search_service, cid, safe_source, negative=True)
+                if copy_negative_keywords else None
+            )
+
+            # 3. Create the new ad group
+            ag_service = get_service("AdGroupService")
+            ag_op = client.get_type("AdGroupOperation")
+            new_ag = ag_op.create
+            new_ag.name = clone_name
+            new_ag.status = client.enums.AdGroupStatusEnum.PAUSED
+            new_ag.campaign = f"customers/{cid}/campaigns/{campaign_id}"
+            new_ag.type_ = source.ad_group.type_
+            if source.ad_group.cpc_bid_micros:
+                new_ag.cpc_bid_micros = source.ad_group.cpc_bid_micros
+
+            ag_response = ag_service.mutate_ad_groups(customer_id=cid, operations=[ag_op])
+            new_ag_resource = ag_response.results[0].resource_name
+            new_ag_id = new_ag_resource.rpartition("/")[2]
+
+            keywords = kw_future.result() if kw_future else []
+            negatives = neg_future.result() if neg_future else []
+
+        # 4. Copy keywords and negatives in a single request, so the clone gets all or none of them
+        enabled = client.enums.AdGroupCriterionStatusEnum.ENABLED
+        criterion_ops = []
+        for text, match_type, cpc_bid_micros in keywords:
+            op = client.get_type("AdGroupCriterionOperation")
+            criterion = op.create
+            criterion.ad_group = new_ag_resource
+            criterion.status = enabled
+            criterion.keyword.text = text
+            criterion.keyword.match_type = match_type
+            if cpc_bid_micros:
+                criterion.cpc_bid_micros = cpc_bid_micros
+            criterion_ops.append(op)
+        for text, match_type, _ in negatives:
+            op = client.get_type("AdGroupCriterionOperation")
+            criterion = op.create
+            criterion.ad_group = new_ag_resource
+            criterion.negative = True
+            criterion.keyword.text = text
+            criterion.keyword.match_type = match_type
+            criterion_ops.append(op)
 
         copied_keywords = 0
         copied_negatives = 0
-
-        # 3. Copy keywords
-        if copy_keywords:
-            kw_query = f"""
-                SELECT
-                    ad_group_criterion.keyword.text,
-                    ad_group_criterion.keyword.match_type,
-                    ad_group_criterion.cpc_bid_micros,
-                    ad_group_criterion.negative
-                FROM ad_group_criterion
-                WHERE ad_group.id = {safe_source}
-                    AND ad_group_criterion.type = 'KEYWORD'
-                    AND ad_group_criterion.negative = false
-                    AND ad_group_criterion.status != 'REMOVED'
-                LIMIT 5000
-            """
-            kw_response = search_service.search(customer_id=cid, query=kw_query)
-            kw_service = get_service("AdGroupCriterionService")
-            kw_ops = []
-            for row in kw_response:
-                op = client.get_type("AdGroupCriterionOperation")
-                criterion = op.create
-                criterion.ad_group = f"customers/{cid}/adGroups/{new_ag_id}"
-                criterion.status = client.enums.AdGroupCriterionStatusEnum.ENABLED
-                criterion.keyword.text = row.ad_group_criterion.keyword.text
-                criterion.keyword.match_type = row.ad_group_criterion.keyword.match_type
-                if row.ad_group_criterion.cpc_bid_micros:
-                    criterion.cpc_bid_micros = row.ad_group_criterion.cpc_bid_micros
-                kw_ops.append(op)
-
-            if kw_ops:
-                kw_result = kw_service.mutate_ad_group_criteria(customer_id=cid, operations=kw_ops)
-                copied_keywords = len(kw_result.results)
-
-        # 4. Copy negative keywords
-        if copy_negative_keywords:
-            neg_query = f"""
-                SELECT
-                    ad_group_criterion.keyword.text,
-                    ad_group_criterion.keyword.match_type
-                FROM ad_group_criterion
-                WHERE ad_group.id = {safe_source}
-                    AND ad_group_criterion.type = 'KEYWORD'
-                    AND ad_group_criterion.negative = true
-                    AND ad_group_criterion.status != 'REMOVED'
-                LIMIT 5000
-            """
-            neg_response = search_service.search(customer_id=cid, query=neg_query)
-            neg_service = get_service("AdGroupCriterionService")
-            neg_ops = []
-            for row in neg_response:
-                op = client.get_type("AdGroupCriterionOperation")
-                criterion = op.create
-                criterion.ad_group = f"customers/{cid}/adGroups/{new_ag_id}"
-                criterion.negative = True
-                criterion.keyword.text = row.ad_group_criterion.keyword.text
-                criterion.keyword.match_type = row.ad_group_criterion.keyword.match_type
-                neg_ops.append(op)
-
-            if neg_ops:
-                neg_result = neg_service.mutate_ad_group_criteria(customer_id=cid, operations=neg_ops)
-                copied_negatives = len(neg_result.results)
+        if criterion_ops:
+            criterion_service = get_service("AdGroupCriterionService")
+            criterion_service.mutate_ad_group_criteria(customer_id=cid, operations=criterion_ops)
+            copied_keywords = len(keywords)
+            copied_negatives = len(negatives)
 
         return success_response(
             {
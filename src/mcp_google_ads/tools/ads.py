@@ -5,13 +5,13 @@ from __future__ import annotations
 import logging
 from typing import Annotated
 
-from google.api_core import protobuf_helpers
-
 from ..auth import get_client, get_service
 from ..coordinator import mcp
 from ..utils import (
+    enum_name,
     error_response,
     resolve_customer_id,
+    search_stream_rows,
     success_response,
     validate_enum_value,
     validate_limit,
@@ -63,20 +63,20 @@ def list_ads(
             ORDER BY ad_group_ad.ad.id ASC
             LIMIT {limit}
         """
-        response = service.search(customer_id=cid, query=query)
         ads_list = []
-        for row in response:
-            headlines = [h.text for h in row.ad_group_ad.ad.responsive_search_ad.headlines]
-            descriptions = [d.text for d in row.ad_group_ad.ad.responsive_search_ad.descriptions]
+        for row in search_stream_rows(service, cid, query):
+            ad_group_ad = row.ad_group_ad
+            ad = ad_group_ad.ad
+            rsa = ad.responsive_search_ad
             ads_list.append({
-                "ad_id": str(row.ad_group_ad.ad.id),
-                "name": row.ad_group_ad.ad.name,
-                "type": row.ad_group_ad.ad.type_.name,
-                "status": row.ad_group_ad.status.name,
-                "final_urls": list(row.ad_group_ad.ad.final_urls),
-                "headlines": headlines,
-                "descriptions": descriptions,
-                "ad_strength": row.ad_group_ad.ad_strength.name,
+                "ad_id": str(ad.id),
+                "name": ad.name,
+                "type": enum_name(ad, "type_"),
+                "status": enum_name(ad_group_ad, "status"),
+                "final_urls": list(ad.final_urls),
+                "headlines": [h.text for h in rsa.headlines],
+                "descriptions": [d.text for d in rsa.descriptions],
+                "ad_strength": enum_name(ad_group_ad, "ad_strength"),
                 "ad_group_id": str(row.ad_group.id),
                 "ad_group_name": row.ad_group.name,
                 "campaign_id": str(row.campaign.id),
@@ -145,13 +145,8 @@ def get_ad(
         return error_response(f"Failed to get ad: {e}")
 
 
-_PIN_FIELD_MAP = {
-    "HEADLINE_1": "HEADLINE_1",
-    "HEADLINE_2": "HEADLINE_2",
-    "HEADLINE_3": "HEADLINE_3",
-    "DESCRIPTION_1": "DESCRIPTION_1",
-    "DESCRIPTION_2": "DESCRIPTION_2",
-}
+_HEADLINE_PINS = frozenset({"HEADLINE_1", "HEADLINE_2", "HEADLINE_3"})
+_DESCRIPTION_PINS = frozenset({"DESCRIPTION_1", "DESCRIPTION_2"})
 
 
 @mcp.tool()
@@ -186,11 +181,11 @@ def create_responsive_search_ad(
         # Validar pins antes de chamar a API
         if pinned_headlines:
             for idx, pin_value in pinned_headlines.items():
-                if pin_value not in ("HEADLINE_1", "HEADLINE_2", "HEADLINE_3"):
+                if pin_value not in _HEADLINE_PINS:
                     return error_response(f"Invalid pin position '{pin_value}' for headline {idx}. Use HEADLINE_1, HEADLINE_2, or HEADLINE_3")
         if pinned_descriptions:
             for idx, pin_value in pinned_descriptions.items():
-                if pin_value not in ("DESCRIPTION_1", "DESCRIPTION_2"):
+                if pin_value not in _DESCRIPTION_PINS:
                     return error_response(f"Invalid pin position '{pin_value}' for description {idx}. Use DESCRIPTION_1 or DESCRIPTION_2")
 
         cid = resolve_customer_id(customer_id)
@@ -205,19 +200,17 @@ def create_responsive_search_ad(
         ad = ad_group_ad.ad
         ad.final_urls.append(final_url)
 
-        for i, headline_text in enumerate(headlines):
-            headline = client.get_type("AdTextAsset")
-            headline.text = headline_text
-            if pinned_headlines and i in pinned_headlines:
-                headline.pinned_field = getattr(client.enums.ServedAssetFieldTypeEnum, pinned_headlines[i])
-            ad.responsive_search_ad.headlines.append(headline)
-
-        for i, desc_text in enumerate(descriptions):
-            description = client.get_type("AdTextAsset")
-            description.text = desc_text
-            if pinned_descriptions and i in pinned_descriptions:
-                description.pinned_field = getattr(client.enums.ServedAssetFieldTypeEnum, pinned_descriptions[i])
-            ad.responsive_search_ad.descriptions.append(description)
+        # add() no protobuf cru constrói o AdTextAsset no lugar, sem cópia
+        rsa = type(ad.responsive_search_ad).pb(ad.responsive_search_ad)
+        pin_fields = client.enums.ServedAssetFieldTypeEnum
+        for texts, assets, pins in (
+            (headlines, rsa.headlines, pinned_headlines or {}),
+            (descriptions, rsa.descriptions, pinned_descriptions or {}),
+        ):
+            for i, text in enumerate(texts):
+                asset = assets.add(text=text)
+                if i in pins:
+                    asset.pinned_field = getattr(pin_fields, pins[i])
 
         if path1:
             ad.responsive_search_ad.path1 = path1
@@ -255,6 +248,8 @@ def update_ad(
         cid = resolve_customer_id(customer_id)
         safe_ag = validate_numeric_id(ad_group_id, "ad_group_id")
         safe_ad = validate_numeric_id(ad_id, "ad_id")
+        if final_url is None and path1 is None and path2 is None:
+            return error_response("No fields to update")
         client = get_client()
         service = get_service("AdGroupAdService")
 
@@ -273,13 +268,7 @@ def update_ad(
             ad_group_ad.ad.responsive_search_ad.path2 = path2
             fields.append("ad.responsive_search_ad.path2")
 
-        if not fields:
-            return error_response("No fields to update")
-
-        client.copy_from(
-            operation.update_mask,
-            protobuf_helpers.field_mask_pb2.FieldMask(paths=fields),
-        )
+        operation.update_mask.paths.extend(fields)
 
         response = service.mutate_ad_group_ads(customer_id=cid, operations=[operation])
         return success_response(
@@ -316,10 +305,7 @@ def set_ad_status(
             ad_group_ad = operation.update
             ad_group_ad.resource_name = resource_name
             ad_group_ad.status = getattr(client.enums.AdGroupAdStatusEnum, status)
-            client.copy_from(
-                operation.update_mask,
-                protobuf_helpers.field_mask_pb2.FieldMask(paths=["status"]),
-            )
+            operation.update_mask.paths.append("status")
 
         response = service.mutate_ad_group_ads(customer_id=cid, operations=[operation])
         return success_response(
@@ -364,13 +350,13 @@ def get_ad_strength(
             ORDER BY ad_group_ad.ad_strength ASC
             LIMIT {limit}
         """
-        response = service.search(customer_id=cid, query=query)
         results = []
-        for row in response:
+        for row in search_stream_rows(service, cid, query):
+            ad_group_ad = row.ad_group_ad
             results.append({
-                "ad_id": str(row.ad_group_ad.ad.id),
-                "ad_strength": row.ad_group_ad.ad_strength.name,
-                "status": row.ad_group_ad.status.name,
+                "ad_id": str(ad_group_ad.ad.id),
+                "ad_strength": enum_name(ad_group_ad, "ad_strength"),
+                "status": enum_name(ad_group_ad, "status"),
                 "ad_group_id": str(row.ad_group.id),
                 "ad_group_name": row.ad_group.name,
                 "campaign_id": str(row.campaign.id),
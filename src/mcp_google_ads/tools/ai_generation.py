@@ -15,6 +15,49 @@ from ..utils import (
 
 logger = logging.getLogger(__name__)
 
+# Serviços que a versão instalada do google-ads não traz (ValueError em get_service)
+_UNAVAILABLE_SERVICES: set[str] = set()
+
+
+def _get_optional_service(client, service_name: str):
+    """Return a Beta service client, or None if this google-ads version lacks it.
+
+    ``client.get_service`` raises ValueError for services missing from the
+    installed API version; the name is remembered so later calls skip the
+    failed import and request construction.
+    """
+    if service_name in _UNAVAILABLE_SERVICES:
+        return None
+    try:
+        return client.get_service(service_name)
+    except ValueError:
+        _UNAVAILABLE_SERVICES.add(service_name)
+        return None
+
+
+def _ad_text_unavailable() -> str:
+    return success_response({
+        "headlines": [],
+        "descriptions": [],
+        "note": "AssetGenerationService not available. Feature requires API v22+ Beta access.",
+    }, message="AI text generation unavailable — use manual copy creation")
+
+
+def _ad_images_unavailable() -> str:
+    return success_response({
+        "images": [],
+        "count": 0,
+        "note": "AssetGenerationService not available. Feature requires API v22+ Beta access.",
+    }, message="AI image generation unavailable — use create_image_asset to upload images manually")
+
+
+def _audience_unavailable(reason: object) -> str:
+    return success_response({
+        "segments": [],
+        "count": 0,
+        "note": f"AudienceInsightsService.GenerateAudienceDefinition not available: {reason}",
+    }, message="AI audience generation unavailable — use list_audience_segments to find segments manually")
+
 
 @mcp.tool()
 def generate_ad_text(
@@ -35,7 +78,9 @@ def generate_ad_text(
 
         # Tenta usar AssetSuggestionService (v22+ Beta)
         try:
-            service = client.get_service("AssetSuggestionService")
+            service = _get_optional_service(client, "AssetSuggestionService")
+            if service is None:
+                return _ad_text_unavailable()
             request = client.get_type("SuggestAssetsRequest")
             request.customer_id = cid
             request.final_url = final_url
@@ -56,11 +101,7 @@ def generate_ad_text(
                 "descriptions": descriptions,
             })
         except Exception:
-            return success_response({
-                "headlines": [],
-                "descriptions": [],
-                "note": "AssetGenerationService not available. Feature requires API v22+ Beta access.",
-            }, message="AI text generation unavailable — use manual copy creation")
+            return _ad_text_unavailable()
     except Exception as e:
         logger.error("Failed to generate ad text: %s", e, exc_info=True)
         return error_response(f"Failed to generate ad text: {e}")
@@ -82,7 +123,9 @@ def generate_ad_images(
 
         # Tenta usar AssetSuggestionService para imagens (v22+ Beta)
         try:
-            service = client.get_service("AssetSuggestionService")
+            service = _get_optional_service(client, "AssetSuggestionService")
+            if service is None:
+                return _ad_images_unavailable()
             request = client.get_type("SuggestImageAssetsRequest")
             request.customer_id = cid
             request.final_url = final_url
@@ -102,11 +145,7 @@ def generate_ad_images(
                 "count": len(images),
             })
         except Exception:
-            return success_response({
-                "images": [],
-                "count": 0,
-                "note": "AssetGenerationService not available. Feature requires API v22+ Beta access.",
-            }, message="AI image generation unavailable — use create_image_asset to upload images manually")
+            return _ad_images_unavailable()
     except Exception as e:
         logger.error("Failed to generate ad images: %s", e, exc_info=True)
         return error_response(f"Failed to generate ad images: {e}")
@@ -127,7 +166,9 @@ def generate_audience_definition(
         client = get_client()
 
         try:
-            service = client.get_service("AudienceInsightsService")
+            service = _get_optional_service(client, "AudienceInsightsService")
+            if service is None:
+                return _audience_unavailable("service missing from the installed google-ads version")
             request = client.get_type("GenerateAudienceDefinitionRequest")
             request.customer_id = cid
             request.audience_description = description
@@ -147,11 +188,7 @@ def generate_audience_definition(
                 "count": len(segments),
             }, message=f"Generated {len(segments)} audience segments from description")
         except Exception as inner_e:
-            return success_response({
-                "segments": [],
-                "count": 0,
-                "note": f"AudienceInsightsService.GenerateAudienceDefinition not available: {inner_e}",
-            }, message="AI audience generation unavailable — use list_audience_segments to find segments manually")
+            return _audience_unavailable(inner_e)
     except Exception as e:
         logger.error("Failed to generate audience definition: %s", e, exc_info=True)
         return error_response(f"Failed to generate audience definition: {e}")
@@ -1,4 +1,4 @@
-"""Audience management tools (15 tools)."""
+"""Audience management tools (16 tools)."""
 
 from __future__ import annotations
 
@@ -10,9 +10,12 @@ from google.api_core import protobuf_helpers
 from ..auth import get_client, get_service
 from ..coordinator import mcp
 from ..utils import (
+    enum_name,
     error_response,
     resolve_customer_id,
+    search_stream_rows,
     success_response,
+    validate_batch,
     validate_enum_value,
     validate_limit,
     validate_numeric_id,
@@ -49,12 +52,13 @@ def list_audience_segments(
         response = service.search(customer_id=cid, query=query)
         segments = []
         for row in response:
+            audience = row.audience
             segments.append({
-                "audience_id": str(row.audience.id),
-                "name": row.audience.name,
-                "status": row.audience.status.name,
-                "description": row.audience.description,
-                "type": row.audience.type_.name,
+                "audience_id": str(audience.id),
+                "name": audience.name,
+                "status": audience.status.name,
+                "description": audience.description,
+                "type": audience.type_.name,
             })
         return success_response({"segments": segments, "count": len(segments)})
     except Exception as e:
@@ -93,6 +97,60 @@ def add_audience_targeting(
         return error_response(f"Failed to add audience targeting: {e}")
 
 
+@mcp.tool()
+def bulk_add_audience_targeting(
+    customer_id: Annotated[str, "The Google Ads customer ID"],
+    targets: Annotated[
+        list[dict],
+        "List of dicts with campaign_id, audience_id and optionally bid_modifier (float)",
+    ],
+) -> str:
+    """Add audience segments as targeting criteria to multiple campaigns in a single API call.
+
+    Example: [{"campaign_id": "111", "audience_id": "222"},
+              {"campaign_id": "333", "audience_id": "222", "bid_modifier": 1.2}]
+    """
+    try:
+        cid = resolve_customer_id(customer_id)
+
+        if not targets:
+            return error_response("targets cannot be empty")
+        error = validate_batch(targets, max_size=5000, required_fields=["campaign_id", "audience_id"], item_name="targets")
+        if error:
+            return error_response(error)
+        safe_targets = [
+            (
+                validate_numeric_id(str(item["campaign_id"]), "campaign_id"),
+                validate_numeric_id(str(item["audience_id"]), "audience_id"),
+                item.get("bid_modifier"),
+            )
+            for item in targets
+        ]
+
+        client = get_client()
+        service = get_service("CampaignCriterionService")
+
+        operations = []
+        for campaign_id, audience_id, bid_modifier in safe_targets:
+            operation = client.get_type("CampaignCriterionOperation")
+            criterion = operation.create
+            criterion.campaign = f"customers/{cid}/campaigns/{campaign_id}"
+            criterion.audience.audience = f"customers/{cid}/audiences/{audience_id}"
+            if bid_modifier is not None:
+                criterion.bid_modifier = float(bid_modifier)
+            operations.append(operation)
+
+        response = service.mutate_campaign_criteria(customer_id=cid, operations=operations)
+        results = [r.resource_name for r in response.results]
+        return success_response(
+            {"added": len(results), "resource_names": results},
+            message=f"{len(results)} audience targeting criteria added",
+        )
+    except Exception as e:
+        logger.error("Failed to bulk add audience targeting: %s", e, exc_info=True)
+        return error_response(f"Failed to bulk add audience targeting: {e}")
+
+
 @mcp.tool()
 def remove_audience_targeting(
     customer_id: Annotated[str, "The Google Ads customer ID"],
@@ -185,15 +243,15 @@ def list_campaign_targeting(
             WHERE campaign.id = {validate_numeric_id(campaign_id, "campaign_id")} {type_filter}
             LIMIT {limit}
         """
-        response = service.search(customer_id=cid, query=query)
         criteria = []
-        for row in response:
+        for row in search_stream_rows(service, cid, query):
+            criterion = row.campaign_criterion
             criteria.append({
-                "criterion_id": str(row.campaign_criterion.criterion_id),
-                "type": row.campaign_criterion.type_.name,
-                "negative": row.campaign_criterion.negative,
-                "bid_modifier": row.campaign_criterion.bid_modifier,
-                "status": row.campaign_criterion.status.name,
+                "criterion_id": str(criterion.criterion_id),
+                "type": enum_name(criterion, "type_"),
+                "negative": criterion.negative,
+                "bid_modifier": criterion.bid_modifier,
+                "status": enum_name(criterion, "status"),
             })
         return success_response({"criteria": criteria, "count": len(criteria)})
     except Exception as e:
@@ -255,17 +313,18 @@ def create_custom_audience(
         audience.name = name
         audience.type_ = getattr(client.enums.CustomAudienceTypeEnum, audience_type)
 
+        # add() no protobuf cru constrói o membro no lugar, sem cópia
+        member_types = client.enums.CustomAudienceMemberTypeEnum
+        audience_members = type(audience).pb(audience).members
         for member in members:
             member_type = member.get("type", "")
             value = member.get("value", "")
             validate_enum_value(member_type, "member_type")
-            m = client.get_type("CustomAudienceMember")
-            m.member_type = getattr(client.enums.CustomAudienceMemberTypeEnum, member_type)
+            m = audience_members.add(member_type=getattr(member_types, member_type))
             if member_type == "KEYWORD":
                 m.keyword = value
             elif member_type == "URL":
                 m.url = value
-            audience.members.append(m)
 
         response = service.mutate_custom_audiences(customer_id=cid, operations=[operation])
         rn = response.results[0].resource_name
@@ -326,17 +385,18 @@ def add_search_theme_signal(
     try:
         cid = resolve_customer_id(customer_id)
         safe_ag = validate_numeric_id(asset_group_id, "asset_group_id")
-        client = get_client()
-        service = get_service("AssetGroupSignalService")
-
         if len(search_themes) > 25:
             return error_response("Maximum 25 search themes per asset group")
 
+        client = get_client()
+        service = get_service("AssetGroupSignalService")
+
+        asset_group = f"customers/{cid}/assetGroups/{safe_ag}"
         operations = []
         for theme in search_themes:
             operation = client.get_type("AssetGroupSignalOperation")
             signal = operation.create
-            signal.asset_group = f"customers/{cid}/assetGroups/{safe_ag}"
+            signal.asset_group = asset_group
             signal.search_theme.text = theme
             operations.append(operation)
 
@@ -375,19 +435,19 @@ def list_asset_group_signals(
             WHERE asset_group.id = {safe_ag}
             LIMIT {limit}
         """
-        response = service.search(customer_id=cid, query=query)
         signals = []
-        for row in response:
+        for row in search_stream_rows(service, cid, query):
+            signal = row.asset_group_signal
             signal_data = {
-                "resource_name": row.asset_group_signal.resource_name,
-                "approval_status": row.asset_group_signal.approval_status.name,
+                "resource_name": signal.resource_name,
+                "approval_status": enum_name(signal, "approval_status"),
             }
-            if row.asset_group_signal.audience.audience:
+            if signal.audience.audience:
                 signal_data["type"] = "audience"
-                signal_data["audience"] = row.asset_group_signal.audience.audience
-            elif row.asset_group_signal.search_theme.text:
+                signal_data["audience"] = signal.audience.audience
+            elif signal.search_theme.text:
                 signal_data["type"] = "search_theme"
-                signal_data["search_theme"] = row.asset_group_signal.search_theme.text
+                signal_data["search_theme"] = signal.search_theme.text
             signals.append(signal_data)
         return success_response({"signals": signals, "count": len(signals)})
     except Exception as e:
@@ -468,15 +528,15 @@ def list_custom_audiences(
             ORDER BY custom_audience.name ASC
             LIMIT {limit}
         """
-        response = service.search(customer_id=cid, query=query)
         audiences = []
-        for row in response:
+        for row in search_stream_rows(service, cid, query):
+            audience = row.custom_audience
             audiences.append({
-                "id": str(row.custom_audience.id),
-                "name": row.custom_audience.name,
-                "type": row.custom_audience.type_.name,
-                "description": row.custom_audience.description,
-                "status": row.custom_audience.status.name,
+                "id": str(audience.id),
+                "name": audience.name,
+                "type": enum_name(audience, "type_"),
+                "description": audience.description,
+                "status": enum_name(audience, "status"),
             })
         return success_response({"audiences": audiences, "count": len(audiences)})
     except Exception as e:
@@ -5,8 +5,6 @@ from __future__ import annotations
 import logging
 from typing import Annotated
 
-from google.api_core import protobuf_helpers
-
 from ..auth import get_client, get_service
 from ..coordinator import mcp
 from ..utils import error_response, resolve_customer_id, success_response, validate_numeric_id
@@ -44,6 +42,9 @@ def batch_set_status(
     try:
         cid = resolve_customer_id(customer_id)
         client = get_client()
+        campaign_status = getattr(client.enums.CampaignStatusEnum, upper_status)
+        ad_group_status = getattr(client.enums.AdGroupStatusEnum, upper_status)
+        ad_status = getattr(client.enums.AdGroupAdStatusEnum, upper_status)
 
         # Construir MutateOperations
         mutate_operations = []
@@ -62,26 +63,18 @@ def batch_set_status(
             mutate_op = client.get_type("MutateOperation")
 
             if resource_type == "campaign":
-                campaign_op = client.get_type("CampaignOperation")
+                campaign_op = mutate_op.campaign_operation
                 campaign = campaign_op.update
                 campaign.resource_name = f"customers/{cid}/campaigns/{safe_id}"
-                campaign.status = getattr(client.enums.CampaignStatusEnum, upper_status)
-                client.copy_from(
-                    campaign_op.update_mask,
-                    protobuf_helpers.field_mask_pb2.FieldMask(paths=["status"]),
-                )
-                client.copy_from(mutate_op.campaign_operation, campaign_op)
+                campaign.status = campaign_status
+                campaign_op.update_mask.paths.append("status")
 
             elif resource_type == "ad_group":
-                ad_group_op = client.get_type("AdGroupOperation")
+                ad_group_op = mutate_op.ad_group_operation
                 ad_group = ad_group_op.update
                 ad_group.resource_name = f"customers/{cid}/adGroups/{safe_id}"
-                ad_group.status = getattr(client.enums.AdGroupStatusEnum, upper_status)
-                client.copy_from(
-                    ad_group_op.update_mask,
-                    protobuf_helpers.field_mask_pb2.FieldMask(paths=["status"]),
-                )
-                client.copy_from(mutate_op.ad_group_operation, ad_group_op)
+                ad_group.status = ad_group_status
+                ad_group_op.update_mask.paths.append("status")
 
             elif resource_type == "ad":
                 ad_group_id = resource.get("ad_group_id", "")
@@ -89,15 +82,11 @@ def batch_set_status(
                     return error_response(f"Item {i}: ad_group_id is required for ads")
                 safe_ag_id = validate_numeric_id(str(ad_group_id), f"item {i} ad_group_id")
 
-                ad_op = client.get_type("AdGroupAdOperation")
+                ad_op = mutate_op.ad_group_ad_operation
                 ad_group_ad = ad_op.update
                 ad_group_ad.resource_name = f"customers/{cid}/adGroupAds/{safe_ag_id}~{safe_id}"
-                ad_group_ad.status = getattr(client.enums.AdGroupAdStatusEnum, upper_status)
-                client.copy_from(
-                    ad_op.update_mask,
-                    protobuf_helpers.field_mask_pb2.FieldMask(paths=["status"]),
-                )
-                client.copy_from(mutate_op.ad_group_ad_operation, ad_op)
+                ad_group_ad.status = ad_status
+                ad_op.update_mask.paths.append("status")
 
             mutate_operations.append(mutate_op)
 
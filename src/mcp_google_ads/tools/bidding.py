@@ -6,8 +6,6 @@ import logging
 import re
 from typing import Annotated
 
-from google.api_core import protobuf_helpers
-
 from ..auth import get_client, get_service
 from ..coordinator import mcp
 from ..utils import error_response, resolve_customer_id, success_response, validate_limit, validate_numeric_id
@@ -214,10 +212,7 @@ def update_bidding_strategy(
         if not fields:
             return error_response("No fields to update")
 
-        client.copy_from(
-            operation.update_mask,
-            protobuf_helpers.field_mask_pb2.FieldMask(paths=fields),
-        )
+        operation.update_mask.paths.extend(fields)
 
         response = service.mutate_bidding_strategies(customer_id=cid, operations=[operation])
         return success_response(
@@ -246,10 +241,7 @@ def set_campaign_bidding_strategy(
         campaign.resource_name = f"customers/{cid}/campaigns/{campaign_id}"
         campaign.bidding_strategy = f"customers/{cid}/biddingStrategies/{strategy_id}"
 
-        client.copy_from(
-            operation.update_mask,
-            protobuf_helpers.field_mask_pb2.FieldMask(paths=["bidding_strategy"]),
-        )
+        operation.update_mask.paths.append("bidding_strategy")
 
         response = service.mutate_campaigns(customer_id=cid, operations=[operation])
         return success_response(
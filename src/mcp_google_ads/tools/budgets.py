@@ -5,8 +5,6 @@ from __future__ import annotations
 import logging
 from typing import Annotated
 
-from google.api_core import protobuf_helpers
-
 from ..auth import get_client, get_service
 from ..coordinator import mcp
 from ..utils import (
@@ -184,10 +182,7 @@ def update_budget(
         if not fields:
             return error_response("No fields to update")
 
-        client.copy_from(
-            operation.update_mask,
-            protobuf_helpers.field_mask_pb2.FieldMask(paths=fields),
-        )
+        operation.update_mask.paths.extend(fields)
 
         response = service.mutate_campaign_budgets(customer_id=cid, operations=[operation])
         return success_response(
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import re
+from collections.abc import Iterable, Iterator, Mapping
 from typing import Any
 
+import orjson
 from google.protobuf.json_format import MessageToDict
 
 from .auth import get_config
@@ -34,13 +36,46 @@ def proto_to_dict(proto_message: Any) -> dict:
         return {"raw": str(proto_message)}
 
 
+def search_stream_rows(service: Any, customer_id: str, query: str) -> Iterator[Any]:
+    """Run a GAQL query via ``search_stream`` and yield raw protobuf rows.
+
+    Rows arrive in server-pushed batches, so callers start building results
+    while the next batch is still in flight. Each batch is unwrapped once, so
+    field reads skip proto-plus marshalling. Enum fields come back as ints:
+    use ``enum_name``.
+    """
+    for batch in service.search_stream(customer_id=customer_id, query=query):
+        yield from (batch._pb if hasattr(batch, "_pb") else batch).results
+
+
+@functools.lru_cache(maxsize=256)
+def _enum_names(descriptor: Any, field_name: str) -> dict[int, str]:
+    """Build the number -> name table for an enum field, once per message type."""
+    return {value.number: value.name for value in descriptor.fields_by_name[field_name].enum_type.values}
+
+
+def enum_name(message: Any, field_name: str) -> str:
+    """Return the name of the enum stored in ``field_name`` of a raw protobuf message."""
+    value = getattr(message, field_name)
+    name = _enum_names(message.DESCRIPTOR, field_name).get(value)
+    return name if name is not None else str(value)
+
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _dumps(payload: dict[str, Any]) -> str:
+    """Serialize a response payload to a JSON string (unknown types fall back to ``str``)."""
+    return orjson.dumps(payload, default=str, option=_ORJSON_OPTIONS).decode()
+
+
 def success_response(data: Any, message: str | None = None) -> str:
     """Build a consistent success JSON response."""
     result: dict[str, Any] = {"status": "success"}
     if message:
         result["message"] = message
     result["data"] = data
-    return json.dumps(result, ensure_ascii=False, default=str)
+    return _dumps(result)
 
 
 def error_response(error: str, details: Any = None) -> str:
@@ -48,7 +83,7 @@ def error_response(error: str, details: Any = None) -> str:
     result: dict[str, Any] = {"status": "error", "error": error}
     if details:
         result["details"] = details
-    return json.dumps(result, ensure_ascii=False, default=str)
+    return _dumps(result)
 
 
 def format_micros(micros: int | None) -> float | None:
@@ -73,11 +108,12 @@ _VALID_DATE_RANGES = {
     "THIS_YEAR", "LAST_YEAR",
 }
 
-_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_DATE_PATTERN = re.compile(r"\A[0-9]{4}-[0-9]{2}-[0-9]{2}\Z")
 
-_NUMERIC_PATTERN = re.compile(r"^\d+$")
+_NUMERIC_PATTERN = re.compile(r"\A[0-9]+\Z")
 
 
+@functools.lru_cache(maxsize=512)
 def validate_status(status: str) -> str:
     """Validate and return a GAQL-safe status value."""
     upper = status.upper()
@@ -101,6 +137,7 @@ def validate_date(date_str: str) -> str:
     return date_str
 
 
+@functools.lru_cache(maxsize=512)
 def validate_numeric_id(value: str, field_name: str = "ID") -> str:
     """Validate that a value is a numeric ID (safe for GAQL)."""
     clean = value.replace("-", "")
@@ -109,9 +146,10 @@ def validate_numeric_id(value: str, field_name: str = "ID") -> str:
     return clean
 
 
-_ENUM_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_ENUM_PATTERN = re.compile(r"\A[A-Za-z_][A-Za-z0-9_]*\Z")
 
 
+@functools.lru_cache(maxsize=512)
 def validate_enum_value(value: str, field_name: str = "value") -> str:
     """Validate that a string looks like a GAQL enum (alphanumeric + underscores only)."""
     if not _ENUM_PATTERN.match(value):
@@ -126,6 +164,27 @@ def validate_limit(limit: int, max_limit: int = 10000) -> int:
     return limit
 
 
+def select_fields(
+    fields: list[str] | None,
+    field_map: Mapping[str, str],
+    required: Iterable[str] = (),
+) -> tuple[tuple[str, ...], str]:
+    """Resolve an optional whitelist of output keys to (keys, GAQL SELECT column list).
+
+    ``field_map`` maps each output key a tool returns to the GAQL column it reads.
+    ``required`` columns (IDs, ORDER BY fields) are always selected.
+    """
+    if fields:
+        invalid = [f for f in fields if f not in field_map]
+        if invalid:
+            raise GoogleAdsMCPError(f"Campos inválidos: {invalid}. Use: {list(field_map)}")
+        keys = tuple(dict.fromkeys(fields))
+    else:
+        keys = tuple(field_map)
+    columns = dict.fromkeys([*required, *(field_map[key] for key in keys)])
+    return keys, ", ".join(columns)
+
+
 def validate_batch(
     items: list,
     max_size: int = 5000,
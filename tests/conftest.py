@@ -82,6 +82,21 @@ def mock_mutate_response():
     return response
 
 
+def make_google_ads_row(data: dict):
+    """Build a real proto-plus GoogleAdsRow from a dict (enums given by name)."""
+    from google.ads.googleads.v23.services.types.google_ads_service import GoogleAdsRow
+    from google.protobuf.json_format import ParseDict
+
+    return GoogleAdsRow.wrap(ParseDict(data, GoogleAdsRow.pb()()))
+
+
+def make_search_stream(rows: list) -> list:
+    """Wrap GoogleAdsRow messages as a single-batch search_stream response."""
+    from google.ads.googleads.v23.services.types.google_ads_service import SearchGoogleAdsStreamResponse
+
+    return [SearchGoogleAdsStreamResponse(results=rows)]
+
+
 def parse_response(response_str: str) -> dict:
     """Parse a JSON response string into a dict."""
     return json.loads(response_str)
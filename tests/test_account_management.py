@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-from tests.conftest import assert_error, assert_success
+from tests.conftest import assert_error, assert_success, make_google_ads_row, make_search_stream
 
 
 class TestListAccountLinks:
@@ -13,18 +13,20 @@ class TestListAccountLinks:
     def test_returns_links(self, mock_resolve, mock_get_service):
         from mcp_google_ads.tools.account_management import list_account_links
 
-        mock_row = MagicMock()
-        mock_row.account_link.account_link_id = 111
-        mock_row.account_link.status.name = "ENABLED"
-        mock_row.account_link.resource_name = "customers/123/accountLinks/111"
+        mock_row = make_google_ads_row({"account_link": {
+            "account_link_id": 111,
+            "status": "ENABLED",
+            "resource_name": "customers/123/accountLinks/111",
+        }})
 
         mock_service = MagicMock()
-        mock_service.search.return_value = [mock_row]
+        mock_service.search_stream.return_value = make_search_stream([mock_row])
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_account_links("123"))
         assert result["data"]["count"] == 1
         assert result["data"]["account_links"][0]["account_link_id"] == "111"
+        assert result["data"]["account_links"][0]["status"] == "ENABLED"
 
     @patch("mcp_google_ads.tools.account_management.get_service")
     @patch("mcp_google_ads.tools.account_management.resolve_customer_id", return_value="123")
@@ -32,7 +34,7 @@ class TestListAccountLinks:
         from mcp_google_ads.tools.account_management import list_account_links
 
         mock_service = MagicMock()
-        mock_service.search.return_value = []
+        mock_service.search_stream.return_value = []
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_account_links("123"))
@@ -83,15 +85,16 @@ class TestListAccountUsers:
     def test_returns_users(self, mock_resolve, mock_get_service):
         from mcp_google_ads.tools.account_management import list_account_users
 
-        mock_row = MagicMock()
-        mock_row.customer_user_access.user_id = 555
-        mock_row.customer_user_access.email_address = "user@example.com"
-        mock_row.customer_user_access.access_role.name = "ADMIN"
-        mock_row.customer_user_access.access_creation_date_time = "2024-01-01"
-        mock_row.customer_user_access.inviter_user_email_address = "admin@example.com"
+        mock_row = make_google_ads_row({"customer_user_access": {
+            "user_id": 555,
+            "email_address": "user@example.com",
+            "access_role": "ADMIN",
+            "access_creation_date_time": "2024-01-01",
+            "inviter_user_email_address": "admin@example.com",
+        }})
 
         mock_service = MagicMock()
-        mock_service.search.return_value = [mock_row]
+        mock_service.search_stream.return_value = make_search_stream([mock_row])
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_account_users("123"))
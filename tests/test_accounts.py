@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-from tests.conftest import assert_error, assert_success
+from tests.conftest import assert_error, assert_success, make_google_ads_row, make_search_stream
 
 
 class TestListAccessibleCustomers:
@@ -104,26 +104,27 @@ class TestGetAccountHierarchy:
     def test_returns_hierarchy(self, mock_resolve, mock_get_service):
         from mcp_google_ads.tools.accounts import get_account_hierarchy
 
-        mock_row_mcc = MagicMock()
-        mock_row_mcc.customer_client.id = 123
-        mock_row_mcc.customer_client.descriptive_name = "MCC Principal"
-        mock_row_mcc.customer_client.level = 0
-        mock_row_mcc.customer_client.manager = True
-        mock_row_mcc.customer_client.status.name = "ENABLED"
-        mock_row_mcc.customer_client.currency_code = "BRL"
-        mock_row_mcc.customer_client.time_zone = "America/Sao_Paulo"
-
-        mock_row_child = MagicMock()
-        mock_row_child.customer_client.id = 456
-        mock_row_child.customer_client.descriptive_name = "Conta Filha"
-        mock_row_child.customer_client.level = 1
-        mock_row_child.customer_client.manager = False
-        mock_row_child.customer_client.status.name = "ENABLED"
-        mock_row_child.customer_client.currency_code = "BRL"
-        mock_row_child.customer_client.time_zone = "America/Sao_Paulo"
+        mock_row_mcc = make_google_ads_row({"customer_client": {
+            "id": 123,
+            "descriptive_name": "MCC Principal",
+            "level": 0,
+            "manager": True,
+            "status": "ENABLED",
+            "currency_code": "BRL",
+            "time_zone": "America/Sao_Paulo",
+        }})
+        mock_row_child = make_google_ads_row({"customer_client": {
+            "id": 456,
+            "descriptive_name": "Conta Filha",
+            "level": 1,
+            "manager": False,
+            "status": "ENABLED",
+            "currency_code": "BRL",
+            "time_zone": "America/Sao_Paulo",
+        }})
 
         mock_service = MagicMock()
-        mock_service.search.return_value = [mock_row_mcc, mock_row_child]
+        mock_service.search_stream.return_value = make_search_stream([mock_row_mcc, mock_row_child])
         mock_get_service.return_value = mock_service
 
         result = assert_success(get_account_hierarchy("123"))
@@ -149,7 +150,7 @@ class TestGetAccountHierarchy:
         from mcp_google_ads.tools.accounts import get_account_hierarchy
 
         mock_service = MagicMock()
-        mock_service.search.return_value = []
+        mock_service.search_stream.return_value = []
         mock_get_service.return_value = mock_service
 
         result = assert_success(get_account_hierarchy("123"))
@@ -169,33 +170,94 @@ class TestGetAccountHierarchy:
         from mcp_google_ads.tools.accounts import get_account_hierarchy
 
         mock_service = MagicMock()
-        mock_service.search.return_value = []
+        mock_service.search_stream.return_value = []
         mock_get_service.return_value = mock_service
 
         get_account_hierarchy(None)
         mock_resolve.assert_called_once_with(None)
 
 
+def _client_row(cid, name, manager=False):
+    return make_google_ads_row({"customer_client": {
+        "id": cid,
+        "descriptive_name": name,
+        "manager": manager,
+        "status": "ENABLED",
+        "currency_code": "BRL",
+        "time_zone": "America/Sao_Paulo",
+    }})
+
+
+class TestGetAccountHierarchyRecursive:
+    @patch("mcp_google_ads.tools.accounts.get_service")
+    @patch("mcp_google_ads.tools.accounts.resolve_customer_id", return_value="100")
+    def test_walks_nested_managers(self, mock_resolve, mock_get_service):
+        from mcp_google_ads.tools.accounts import get_account_hierarchy_recursive
+
+        tree = {
+            "100": [_client_row(200, "Sub MCC", manager=True), _client_row(300, "Conta A")],
+            "200": [_client_row(400, "Conta B")],
+        }
+        mock_service = MagicMock()
+        mock_service.search_stream.side_effect = (
+            lambda customer_id, query: make_search_stream(tree.get(customer_id, []))
+        )
+        mock_get_service.return_value = mock_service
+
+        result = assert_success(get_account_hierarchy_recursive("100"))
+        accounts = {a["customer_id"]: a for a in result["data"]["accounts"]}
+        assert result["data"]["count"] == 3
+        assert result["data"]["truncated"] is False
+        assert accounts["200"]["depth"] == 1
+        assert accounts["200"]["is_manager"] is True
+        assert accounts["300"]["parent_id"] == "100"
+        assert accounts["400"]["depth"] == 2
+        assert accounts["400"]["parent_id"] == "200"
+        assert accounts["400"]["status"] == "ENABLED"
+
+    @patch("mcp_google_ads.tools.accounts.get_service")
+    @patch("mcp_google_ads.tools.accounts.resolve_customer_id", return_value="100")
+    def test_stops_at_max_depth(self, mock_resolve, mock_get_service):
+        from mcp_google_ads.tools.accounts import get_account_hierarchy_recursive
+
+        mock_service = MagicMock()
+        mock_service.search_stream.side_effect = (
+            lambda customer_id, query: make_search_stream([_client_row(200, "Sub MCC", manager=True)])
+            if customer_id == "100" else make_search_stream([_client_row(400, "Conta B")])
+        )
+        mock_get_service.return_value = mock_service
+
+        result = assert_success(get_account_hierarchy_recursive("100", max_depth=1))
+        assert result["data"]["count"] == 1
+        assert result["data"]["truncated"] is True
+        assert mock_service.search_stream.call_count == 1
+
+    @patch("mcp_google_ads.tools.accounts.get_service")
+    @patch("mcp_google_ads.tools.accounts.resolve_customer_id", return_value="100")
+    def test_invalid_max_depth(self, mock_resolve, mock_get_service):
+        from mcp_google_ads.tools.accounts import get_account_hierarchy_recursive
+
+        for max_depth in (0, 11):
+            result = assert_error(get_account_hierarchy_recursive("100", max_depth=max_depth))
+            assert result["error"] == f"max_depth deve ser entre 1 e 10, recebido: {max_depth}"
+        mock_get_service.assert_not_called()
+
+
 class TestListCustomerClients:
     @patch("mcp_google_ads.tools.accounts.get_service")
     @patch("mcp_google_ads.tools.accounts.resolve_customer_id", return_value="123")
     def test_returns_clients(self, mock_resolve, mock_get_service):
         from mcp_google_ads.tools.accounts import list_customer_clients
 
-        mock_row1 = MagicMock()
-        mock_row1.customer_client.id = 456
-        mock_row1.customer_client.descriptive_name = "Cliente A"
-        mock_row1.customer_client.status.name = "ENABLED"
-        mock_row1.customer_client.currency_code = "BRL"
-
-        mock_row2 = MagicMock()
-        mock_row2.customer_client.id = 789
-        mock_row2.customer_client.descriptive_name = "Cliente B"
-        mock_row2.customer_client.status.name = "PAUSED"
-        mock_row2.customer_client.currency_code = "USD"
+        mock_row1 = make_google_ads_row({"customer_client": {
+            "id": 456, "descriptive_name": "Cliente A", "status": "ENABLED", "currency_code": "BRL",
+        }})
+        mock_row2 = make_google_ads_row({"customer_client": {
+            "id": 789, "descriptive_name": "Cliente B", "status": "CANCELED", "currency_code": "USD",
+        }})
 
         mock_service = MagicMock()
-        mock_service.search.return_value = [mock_row1, mock_row2]
+        mock_service.search_stream.return_value = make_search_stream([mock_row1, mock_row2])
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_customer_clients("123"))
@@ -209,7 +271,7 @@ class TestListCustomerClients:
 
         assert clients[1]["customer_id"] == "789"
         assert clients[1]["name"] == "Cliente B"
-        assert clients[1]["status"] == "PAUSED"
+        assert clients[1]["status"] == "CANCELED"
         assert clients[1]["currency"] == "USD"
 
     @patch("mcp_google_ads.tools.accounts.get_service")
@@ -218,13 +280,28 @@ class TestListCustomerClients:
         from mcp_google_ads.tools.accounts import list_customer_clients
 
         mock_service = MagicMock()
-        mock_service.search.return_value = []
+        mock_service.search_stream.return_value = []
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_customer_clients("123"))
         assert result["data"]["count"] == 0
         assert result["data"]["clients"] == []
 
+    @patch("mcp_google_ads.tools.accounts.get_service")
+    @patch("mcp_google_ads.tools.accounts.resolve_customer_id", return_value="123")
+    def test_fields_narrows_select_and_output(self, mock_resolve, mock_get_service):
+        from mcp_google_ads.tools.accounts import list_customer_clients
+
+        mock_service = MagicMock()
+        mock_service.search_stream.return_value = make_search_stream([_client_row(456, "Conta Filha")])
+        mock_get_service.return_value = mock_service
+
+        result = assert_success(list_customer_clients("123", fields=["customer_id"]))
+        assert result["data"]["clients"] == [{"customer_id": "456"}]
+        query_called = mock_service.search_stream.call_args[1]["query"]
+        assert "customer_client.currency_code" not in query_called
+        assert "customer_client.descriptive_name" in query_called
+
     @patch("mcp_google_ads.tools.accounts.resolve_customer_id", side_effect=Exception("No ID"))
     def test_error_handling(self, mock_resolve):
         from mcp_google_ads.tools.accounts import list_customer_clients
@@ -238,7 +315,7 @@ class TestListCustomerClients:
         from mcp_google_ads.tools.accounts import list_customer_clients
 
         mock_service = MagicMock()
-        mock_service.search.return_value = []
+        mock_service.search_stream.return_value = []
         mock_get_service.return_value = mock_service
 
         list_customer_clients(None)
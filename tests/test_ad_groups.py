@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-from tests.conftest import assert_error, assert_success
+from tests.conftest import assert_error, assert_success, make_google_ads_row, make_search_stream
 
 # --- Helper para criar mock de row de ad_group ---
 
@@ -21,19 +21,20 @@ def _make_ad_group_row(
     campaign_id=111,
     campaign_name="Campaign 1",
 ):
-    row = MagicMock()
-    row.ad_group.id = ad_group_id
-    row.ad_group.name = name
-    row.ad_group.status.name = status
-    row.ad_group.type_.name = type_name
-    row.ad_group.cpc_bid_micros = cpc_bid_micros
-    row.ad_group.cpm_bid_micros = cpm_bid_micros
-    row.ad_group.target_cpa_micros = target_cpa_micros
-    row.ad_group.target_roas = target_roas
-    row.ad_group.effective_target_cpa_micros = effective_target_cpa_micros
-    row.campaign.id = campaign_id
-    row.campaign.name = campaign_name
-    return row
+    return make_google_ads_row({
+        "ad_group": {
+            "id": ad_group_id,
+            "name": name,
+            "status": status,
+            "type_": type_name,
+            "cpc_bid_micros": cpc_bid_micros,
+            "cpm_bid_micros": cpm_bid_micros,
+            "target_cpa_micros": target_cpa_micros,
+            "target_roas": target_roas,
+            "effective_target_cpa_micros": effective_target_cpa_micros,
+        },
+        "campaign": {"id": campaign_id, "name": campaign_name},
+    })
 
 
 def _mock_mutate_response(resource_name="customers/123/adGroups/222"):
@@ -52,13 +53,37 @@ class TestListAdGroups:
 
         mock_row = _make_ad_group_row()
         mock_service = MagicMock()
-        mock_service.search.return_value = [mock_row]
+        mock_service.search_stream.return_value = make_search_stream([mock_row])
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_ad_groups("123"))
         assert result["data"]["count"] == 1
         assert result["data"]["ad_groups"][0]["name"] == "Ad Group 1"
 
+    @patch("mcp_google_ads.tools.ad_groups.get_service")
+    @patch("mcp_google_ads.tools.ad_groups.resolve_customer_id", return_value="123")
+    def test_fields_narrows_select_and_output(self, mock_resolve, mock_get_service):
+        from mcp_google_ads.tools.ad_groups import list_ad_groups
+
+        mock_service = MagicMock()
+        mock_service.search_stream.return_value = make_search_stream([_make_ad_group_row()])
+        mock_get_service.return_value = mock_service
+
+        result = assert_success(list_ad_groups("123", fields=["ad_group_id", "cpc_bid"]))
+        assert result["data"]["ad_groups"] == [{"ad_group_id": "222", "cpc_bid": 1.5}]
+        query_called = mock_service.search_stream.call_args[1]["query"]
+        assert "ad_group.cpc_bid_micros" in query_called
+        assert "campaign.name" not in query_called
+
+    @patch("mcp_google_ads.tools.ad_groups.get_service")
+    @patch("mcp_google_ads.tools.ad_groups.resolve_customer_id", return_value="123")
+    def test_invalid_field(self, mock_resolve, mock_get_service):
+        from mcp_google_ads.tools.ad_groups import list_ad_groups
+
+        result = assert_error(list_ad_groups("123", fields=["metrics.clicks"]))
+        assert "Campos inválidos" in result["error"]
+        mock_get_service.assert_not_called()
+
     @patch("mcp_google_ads.tools.ad_groups.resolve_customer_id", side_effect=Exception("fail"))
     def test_error_handling(self, mock_resolve):
         from mcp_google_ads.tools.ad_groups import list_ad_groups
@@ -73,12 +98,12 @@ class TestListAdGroups:
 
         mock_row = _make_ad_group_row()
         mock_service = MagicMock()
-        mock_service.search.return_value = [mock_row]
+        mock_service.search_stream.return_value = make_search_stream([mock_row])
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_ad_groups("123", campaign_id="111"))
         assert result["data"]["count"] == 1
-        query_called = mock_service.search.call_args[1]["query"]
+        query_called = mock_service.search_stream.call_args[1]["query"]
         assert "campaign.id = 111" in query_called
 
     @patch("mcp_google_ads.tools.ad_groups.get_service")
@@ -87,12 +112,12 @@ class TestListAdGroups:
         from mcp_google_ads.tools.ad_groups import list_ad_groups
 
         mock_service = MagicMock()
-        mock_service.search.return_value = []
+        mock_service.search_stream.return_value = []
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_ad_groups("123", status_filter="PAUSED"))
         assert result["data"]["count"] == 0
-        query_called = mock_service.search.call_args[1]["query"]
+        query_called = mock_service.search_stream.call_args[1]["query"]
         assert "ad_group.status = 'PAUSED'" in query_called
 
     @patch("mcp_google_ads.tools.ad_groups.get_service")
@@ -101,11 +126,11 @@ class TestListAdGroups:
         from mcp_google_ads.tools.ad_groups import list_ad_groups
 
         mock_service = MagicMock()
-        mock_service.search.return_value = []
+        mock_service.search_stream.return_value = []
         mock_get_service.return_value = mock_service
 
         assert_success(list_ad_groups("123", campaign_id="111", status_filter="ENABLED"))
-        query_called = mock_service.search.call_args[1]["query"]
+        query_called = mock_service.search_stream.call_args[1]["query"]
         assert "campaign.id = 111" in query_called
         assert "ad_group.status = 'ENABLED'" in query_called
 
@@ -123,7 +148,7 @@ class TestListAdGroups:
         from mcp_google_ads.tools.ad_groups import list_ad_groups
 
         mock_service = MagicMock()
-        mock_service.search.return_value = []
+        mock_service.search_stream.return_value = []
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_ad_groups("123"))
@@ -141,11 +166,12 @@ class TestListAdGroups:
             _make_ad_group_row(ad_group_id=3, name="Group C"),
         ]
         mock_service = MagicMock()
-        mock_service.search.return_value = rows
+        mock_service.search_stream.return_value = make_search_stream(rows[:2]) + make_search_stream(rows[2:])
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_ad_groups("123"))
         assert result["data"]["count"] == 3
+        assert [g["name"] for g in result["data"]["ad_groups"]] == ["Group A", "Group B", "Group C"]
 
     @patch("mcp_google_ads.tools.ad_groups.get_service")
     @patch("mcp_google_ads.tools.ad_groups.resolve_customer_id", return_value="123")
@@ -170,7 +196,7 @@ class TestListAdGroups:
             campaign_name="Test Campaign",
         )
         mock_service = MagicMock()
-        mock_service.search.return_value = [mock_row]
+        mock_service.search_stream.return_value = make_search_stream([mock_row])
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_ad_groups("123"))
@@ -346,6 +372,15 @@ class TestCreateAdGroup:
         result = assert_error(create_ad_group("123", "111", "Bad Type", ad_group_type="INVALID TYPE!"))
         assert "inválido" in result["error"]
 
+    @patch("mcp_google_ads.tools.ad_groups.get_client")
+    @patch("mcp_google_ads.tools.ad_groups.resolve_customer_id", return_value="123")
+    def test_rejects_cpc_in_micros_before_client(self, mock_resolve, mock_get_client):
+        from mcp_google_ads.tools.ad_groups import create_ad_group
+
+        result = assert_error(create_ad_group("123", "111", "AG", cpc_bid=0.05))
+        assert "suspiciously low" in result["error"]
+        mock_get_client.assert_not_called()
+
 
 class TestUpdateAdGroup:
     @patch("mcp_google_ads.tools.ad_groups.get_service")
@@ -431,6 +466,7 @@ class TestUpdateAdGroup:
 
         result = assert_error(update_ad_group("123", "222"))
         assert "No fields to update" in result["error"]
+        mock_get_client.assert_not_called()
 
     @patch("mcp_google_ads.tools.ad_groups.get_service")
     @patch("mcp_google_ads.tools.ad_groups.get_client")
@@ -614,6 +650,54 @@ class TestRemoveAdGroup:
         assert "Failed to remove ad group" in result["error"]
 
 
+class TestRemoveAdGroups:
+    @patch("mcp_google_ads.tools.ad_groups.get_service")
+    @patch("mcp_google_ads.tools.ad_groups.get_client")
+    @patch("mcp_google_ads.tools.ad_groups.resolve_customer_id", return_value="123")
+    def test_removes_in_single_call(self, mock_resolve, mock_get_client, mock_get_service, mock_google_ads_client):
+        from mcp_google_ads.tools.ad_groups import remove_ad_groups
+
+        mock_get_client.return_value = mock_google_ads_client
+        response = MagicMock()
+        response.results = [
+            MagicMock(resource_name="customers/123/adGroups/1"),
+            MagicMock(resource_name="customers/123/adGroups/2"),
+        ]
+        mock_service = MagicMock()
+        mock_service.mutate_ad_groups.return_value = response
+        mock_get_service.return_value = mock_service
+
+        result = assert_success(remove_ad_groups("123", ["1", "2"]))
+        assert result["data"]["removed"] == 2
+        mock_service.mutate_ad_groups.assert_called_once()
+        operations = mock_service.mutate_ad_groups.call_args[1]["operations"]
+        assert [op.remove for op in operations] == ["customers/123/adGroups/1", "customers/123/adGroups/2"]
+
+    @patch("mcp_google_ads.tools.ad_groups.get_service")
+    @patch("mcp_google_ads.tools.ad_groups.get_client")
+    @patch("mcp_google_ads.tools.ad_groups.resolve_customer_id", return_value="123")
+    def test_invalid_id_sends_nothing(self, mock_resolve, mock_get_client, mock_get_service):
+        from mcp_google_ads.tools.ad_groups import remove_ad_groups
+
+        result = assert_error(remove_ad_groups("123", ["1", "abc"]))
+        assert "inválido" in result["error"]
+        mock_get_service.return_value.mutate_ad_groups.assert_not_called()
+
+    @patch("mcp_google_ads.tools.ad_groups.resolve_customer_id", return_value="123")
+    def test_empty_list(self, mock_resolve):
+        from mcp_google_ads.tools.ad_groups import remove_ad_groups
+
+        result = assert_error(remove_ad_groups("123", []))
+        assert "cannot be empty" in result["error"]
+
+    @patch("mcp_google_ads.tools.ad_groups.resolve_customer_id", return_value="123")
+    def test_batch_limit(self, mock_resolve):
+        from mcp_google_ads.tools.ad_groups import remove_ad_groups
+
+        result = assert_error(remove_ad_groups("123", ["1"] * 5001))
+        assert "Maximum 5000" in result["error"]
+
+
 class TestCloneAdGroup:
     @patch("mcp_google_ads.tools.ad_groups.get_service")
     @patch("mcp_google_ads.tools.ad_groups.get_client")
@@ -632,8 +716,7 @@ class TestCloneAdGroup:
         source_row.campaign.id = 555
 
         search_service = MagicMock()
-        # First call: source ad group query; second/third: keyword queries (empty)
-        search_service.search.side_effect = [[source_row], [], []]
+        search_service.search.return_value = [source_row]
 
         ag_service = MagicMock()
         ag_response = MagicMock()
@@ -665,20 +748,23 @@ class TestCloneAdGroup:
         source_row.ad_group.cpc_bid_micros = 2_000_000
         source_row.campaign.id = 555
 
-        kw_row1 = MagicMock()
-        kw_row1.ad_group_criterion.keyword.text = "tarot online"
-        kw_row1.ad_group_criterion.keyword.match_type = MagicMock()
-        kw_row1.ad_group_criterion.cpc_bid_micros = 1_000_000
-        kw_row1.ad_group_criterion.negative = False
-
-        kw_row2 = MagicMock()
-        kw_row2.ad_group_criterion.keyword.text = "consulta tarot"
-        kw_row2.ad_group_criterion.keyword.match_type = MagicMock()
-        kw_row2.ad_group_criterion.cpc_bid_micros = 0
-        kw_row2.ad_group_criterion.negative = False
+        kw_row1 = make_google_ads_row({"ad_group_criterion": {
+            "keyword": {"text": "tarot online", "match_type": "PHRASE"},
+            "cpc_bid_micros": 1_000_000,
+        }})
+        kw_row2 = make_google_ads_row({"ad_group_criterion": {
+            "keyword": {"text": "consulta tarot", "match_type": "EXACT"},
+        }})
 
         search_service = MagicMock()
-        search_service.search.side_effect = [[source_row], [kw_row1, kw_row2], []]
+        search_service.search.return_value = [source_row]
+        neg_row = make_google_ads_row({"ad_group_criterion": {
+            "keyword": {"text": "gratis", "match_type": "BROAD"},
+        }})
+        # Keyword and negative reads run concurrently, so route by query instead of call order
+        search_service.search_stream.side_effect = lambda customer_id, query: make_search_stream(
+            [kw_row1, kw_row2] if "negative = false" in query else [neg_row]
+        )
 
         ag_service = MagicMock()
         ag_response = MagicMock()
@@ -686,9 +772,9 @@ class TestCloneAdGroup:
         ag_service.mutate_ad_groups.return_value = ag_response
 
         kw_service = MagicMock()
-        kw_mutate_response = MagicMock()
-        kw_mutate_response.results = [MagicMock(), MagicMock()]
-        kw_service.mutate_ad_group_criteria.return_value = kw_mutate_response
+        kw_service.mutate_ad_group_criteria.side_effect = lambda customer_id, operations: MagicMock(
+            results=[MagicMock() for _ in operations]
+        )
 
         mock_get_service.side_effect = lambda name: {
             "GoogleAdsService": search_service,
@@ -696,8 +782,20 @@ class TestCloneAdGroup:
             "AdGroupCriterionService": kw_service,
         }[name]
 
+        client.get_type.side_effect = lambda name: MagicMock()
+
         result = assert_success(clone_ad_group("123", "444"))
         assert result["data"]["copied_keywords"] == 2
+        assert result["data"]["copied_negatives"] == 1
+        kw_service.mutate_ad_group_criteria.assert_called_once()
+        ops = kw_service.mutate_ad_group_criteria.call_args[1]["operations"]
+        assert len(ops) == 3
+        assert ops[2].create.keyword.text == "gratis"
+        assert ops[2].create.negative is True
+        assert ops[0].create.keyword.text == "tarot online"
+        assert ops[0].create.cpc_bid_micros == 1_000_000
+        assert ops[1].create.keyword.text == "consulta tarot"
+        assert ops[0].create.ad_group == "customers/123/adGroups/999"
 
     @patch("mcp_google_ads.tools.ad_groups.get_service")
     @patch("mcp_google_ads.tools.ad_groups.get_client")
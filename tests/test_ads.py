@@ -4,22 +4,23 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-from tests.conftest import assert_error, assert_success
+from tests.conftest import assert_error, assert_success, make_google_ads_row, make_search_stream
 
 # --- Helpers ---
 
+def _rsa_operation():
+    """Real AdGroupAdOperation: RSA assets are added on the underlying protobuf message."""
+    from google.ads.googleads.v23.services.types.ad_group_ad_service import AdGroupAdOperation
+
+    return AdGroupAdOperation()
+
+
 def _make_headline(text="Headline"):
-    h = MagicMock()
-    h.text = text
-    h.pinned_field.name = "UNSPECIFIED"
-    return h
+    return {"text": text}
 
 
 def _make_description(text="Description"):
-    d = MagicMock()
-    d.text = text
-    d.pinned_field.name = "UNSPECIFIED"
-    return d
+    return {"text": text}
 
 
 def _make_ad_row(
@@ -41,27 +42,29 @@ def _make_ad_row(
     campaign_id=111,
     campaign_name="Campaign 1",
 ):
-    row = MagicMock()
-    row.ad_group_ad.ad.id = ad_id
-    row.ad_group_ad.ad.name = ad_name
-    row.ad_group_ad.ad.type_.name = type_name
-    row.ad_group_ad.status.name = status
-    row.ad_group_ad.ad_strength.name = ad_strength
-    row.ad_group_ad.ad.final_urls = final_urls or ["https://example.com"]
-    row.ad_group_ad.ad.final_mobile_urls = final_mobile_urls or []
-    row.ad_group_ad.ad.tracking_url_template = tracking_url_template
-
-    row.ad_group_ad.ad.responsive_search_ad.headlines = headlines or []
-    row.ad_group_ad.ad.responsive_search_ad.descriptions = descriptions or []
-    row.ad_group_ad.ad.responsive_search_ad.path1 = path1
-    row.ad_group_ad.ad.responsive_search_ad.path2 = path2
-    row.ad_group_ad.policy_summary.approval_status.name = approval_status
-
-    row.ad_group.id = ad_group_id
-    row.ad_group.name = ad_group_name
-    row.campaign.id = campaign_id
-    row.campaign.name = campaign_name
-    return row
+    return make_google_ads_row({
+        "ad_group_ad": {
+            "ad": {
+                "id": ad_id,
+                "name": ad_name,
+                "type_": type_name,
+                "final_urls": final_urls or ["https://example.com"],
+                "final_mobile_urls": final_mobile_urls or [],
+                "tracking_url_template": tracking_url_template,
+                "responsive_search_ad": {
+                    "headlines": headlines or [],
+                    "descriptions": descriptions or [],
+                    "path1": path1,
+                    "path2": path2,
+                },
+            },
+            "status": status,
+            "ad_strength": ad_strength,
+            "policy_summary": {"approval_status": approval_status},
+        },
+        "ad_group": {"id": ad_group_id, "name": ad_group_name},
+        "campaign": {"id": campaign_id, "name": campaign_name},
+    })
 
 
 def _mock_mutate_response(resource_name="customers/123/adGroupAds/222~333"):
@@ -80,7 +83,7 @@ class TestListAds:
 
         mock_row = _make_ad_row()
         mock_service = MagicMock()
-        mock_service.search.return_value = [mock_row]
+        mock_service.search_stream.return_value = make_search_stream([mock_row])
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_ads("123"))
@@ -99,11 +102,11 @@ class TestListAds:
         from mcp_google_ads.tools.ads import list_ads
 
         mock_service = MagicMock()
-        mock_service.search.return_value = [_make_ad_row()]
+        mock_service.search_stream.return_value = make_search_stream([_make_ad_row()])
         mock_get_service.return_value = mock_service
 
         assert_success(list_ads("123", ad_group_id="222"))
-        query_called = mock_service.search.call_args[1]["query"]
+        query_called = mock_service.search_stream.call_args[1]["query"]
         assert "ad_group.id = 222" in query_called
 
     @patch("mcp_google_ads.tools.ads.get_service")
@@ -112,11 +115,11 @@ class TestListAds:
         from mcp_google_ads.tools.ads import list_ads
 
         mock_service = MagicMock()
-        mock_service.search.return_value = [_make_ad_row()]
+        mock_service.search_stream.return_value = make_search_stream([_make_ad_row()])
         mock_get_service.return_value = mock_service
 
         assert_success(list_ads("123", campaign_id="111"))
-        query_called = mock_service.search.call_args[1]["query"]
+        query_called = mock_service.search_stream.call_args[1]["query"]
         assert "campaign.id = 111" in query_called
 
     @patch("mcp_google_ads.tools.ads.get_service")
@@ -125,11 +128,11 @@ class TestListAds:
         from mcp_google_ads.tools.ads import list_ads
 
         mock_service = MagicMock()
-        mock_service.search.return_value = []
+        mock_service.search_stream.return_value = []
         mock_get_service.return_value = mock_service
 
         assert_success(list_ads("123", status_filter="PAUSED"))
-        query_called = mock_service.search.call_args[1]["query"]
+        query_called = mock_service.search_stream.call_args[1]["query"]
         assert "ad_group_ad.status = 'PAUSED'" in query_called
 
     @patch("mcp_google_ads.tools.ads.get_service")
@@ -138,11 +141,11 @@ class TestListAds:
         from mcp_google_ads.tools.ads import list_ads
 
         mock_service = MagicMock()
-        mock_service.search.return_value = []
+        mock_service.search_stream.return_value = []
         mock_get_service.return_value = mock_service
 
         assert_success(list_ads("123", ad_group_id="222", campaign_id="111", status_filter="ENABLED"))
-        query_called = mock_service.search.call_args[1]["query"]
+        query_called = mock_service.search_stream.call_args[1]["query"]
         assert "ad_group.id = 222" in query_called
         assert "campaign.id = 111" in query_called
         assert "ad_group_ad.status = 'ENABLED'" in query_called
@@ -177,7 +180,7 @@ class TestListAds:
         from mcp_google_ads.tools.ads import list_ads
 
         mock_service = MagicMock()
-        mock_service.search.return_value = []
+        mock_service.search_stream.return_value = []
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_ads("123"))
@@ -193,7 +196,7 @@ class TestListAds:
         descriptions = [_make_description("D1")]
         mock_row = _make_ad_row(headlines=headlines, descriptions=descriptions)
         mock_service = MagicMock()
-        mock_service.search.return_value = [mock_row]
+        mock_service.search_stream.return_value = make_search_stream([mock_row])
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_ads("123"))
@@ -219,7 +222,7 @@ class TestListAds:
             campaign_name="Campaign X",
         )
         mock_service = MagicMock()
-        mock_service.search.return_value = [mock_row]
+        mock_service.search_stream.return_value = make_search_stream([mock_row])
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_ads("123"))
@@ -316,7 +319,7 @@ class TestCreateResponsiveSearchAd:
 
         mock_client = MagicMock()
         mock_client.enums.AdGroupAdStatusEnum.PAUSED = 2
-        operation = MagicMock()
+        operation = _rsa_operation()
         mock_client.get_type.return_value = operation
         mock_get_client.return_value = mock_client
 
@@ -342,7 +345,7 @@ class TestCreateResponsiveSearchAd:
 
         mock_client = MagicMock()
         mock_client.enums.AdGroupAdStatusEnum.PAUSED = 2
-        operation = MagicMock()
+        operation = _rsa_operation()
         mock_client.get_type.return_value = operation
         mock_get_client.return_value = mock_client
 
@@ -434,7 +437,7 @@ class TestCreateResponsiveSearchAd:
 
         mock_client = MagicMock()
         mock_client.enums.AdGroupAdStatusEnum.PAUSED = 2
-        operation = MagicMock()
+        operation = _rsa_operation()
         mock_client.get_type.return_value = operation
         mock_get_client.return_value = mock_client
 
@@ -461,7 +464,7 @@ class TestCreateResponsiveSearchAd:
         mock_client.enums.AdGroupAdStatusEnum.PAUSED = 2
         mock_client.enums.ServedAssetFieldTypeEnum.HEADLINE_1 = 2
         mock_client.enums.ServedAssetFieldTypeEnum.HEADLINE_2 = 3
-        operation = MagicMock()
+        operation = _rsa_operation()
         mock_client.get_type.return_value = operation
         mock_get_client.return_value = mock_client
 
@@ -488,7 +491,7 @@ class TestCreateResponsiveSearchAd:
         mock_client = MagicMock()
         mock_client.enums.AdGroupAdStatusEnum.PAUSED = 2
         mock_client.enums.ServedAssetFieldTypeEnum.DESCRIPTION_1 = 5
-        operation = MagicMock()
+        operation = _rsa_operation()
         mock_client.get_type.return_value = operation
         mock_get_client.return_value = mock_client
 
@@ -516,7 +519,7 @@ class TestCreateResponsiveSearchAd:
         mock_client.enums.ServedAssetFieldTypeEnum.HEADLINE_1 = 2
         mock_client.enums.ServedAssetFieldTypeEnum.HEADLINE_3 = 4
         mock_client.enums.ServedAssetFieldTypeEnum.DESCRIPTION_1 = 5
-        operation = MagicMock()
+        operation = _rsa_operation()
         mock_client.get_type.return_value = operation
         mock_get_client.return_value = mock_client
 
@@ -534,6 +537,41 @@ class TestCreateResponsiveSearchAd:
         ))
         assert result["data"]["pins"] == 3
 
+    @patch("mcp_google_ads.tools.ads.get_service")
+    @patch("mcp_google_ads.tools.ads.get_client")
+    @patch("mcp_google_ads.tools.ads.resolve_customer_id", return_value="123")
+    def test_create_builds_text_assets_on_operation(self, mock_resolve, mock_get_client, mock_get_service):
+        from google.ads.googleads.v23.enums.types.served_asset_field_type import ServedAssetFieldTypeEnum
+        from google.ads.googleads.v23.services.types.ad_group_ad_service import AdGroupAdOperation
+
+        from mcp_google_ads.tools.ads import create_responsive_search_ad
+
+        mock_client = MagicMock()
+        mock_client.enums.AdGroupAdStatusEnum.PAUSED = 2
+        mock_client.enums.ServedAssetFieldTypeEnum = ServedAssetFieldTypeEnum.ServedAssetFieldType
+        operation = AdGroupAdOperation()
+        mock_client.get_type.return_value = operation
+        mock_get_client.return_value = mock_client
+
+        mock_service = MagicMock()
+        mock_service.mutate_ad_group_ads.return_value = _mock_mutate_response()
+        mock_get_service.return_value = mock_service
+
+        assert_success(create_responsive_search_ad(
+            "123", "222",
+            headlines=["H1", "H2", "H3"],
+            descriptions=["D1", "D2"],
+            final_url="https://example.com",
+            pinned_headlines={0: "HEADLINE_1"},
+            pinned_descriptions={1: "DESCRIPTION_2"},
+        ))
+        rsa = operation.create.ad.responsive_search_ad
+        assert [h.text for h in rsa.headlines] == ["H1", "H2", "H3"]
+        assert [d.text for d in rsa.descriptions] == ["D1", "D2"]
+        assert rsa.headlines[0].pinned_field.name == "HEADLINE_1"
+        assert rsa.headlines[1].pinned_field.name == "UNSPECIFIED"
+        assert rsa.descriptions[1].pinned_field.name == "DESCRIPTION_2"
+
     def test_create_with_invalid_headline_pin(self):
         from mcp_google_ads.tools.ads import create_responsive_search_ad
 
@@ -566,7 +604,7 @@ class TestCreateResponsiveSearchAd:
 
         mock_client = MagicMock()
         mock_client.enums.AdGroupAdStatusEnum.PAUSED = 2
-        operation = MagicMock()
+        operation = _rsa_operation()
         mock_client.get_type.return_value = operation
         mock_get_client.return_value = mock_client
 
@@ -621,6 +659,27 @@ class TestUpdateAd:
         result = assert_success(update_ad("123", "222", "333", path1="new-path1", path2="new-path2"))
         assert result["data"]["resource_name"] == "customers/123/adGroupAds/222~333"
 
+    @patch("mcp_google_ads.tools.ads.get_service")
+    @patch("mcp_google_ads.tools.ads.get_client")
+    @patch("mcp_google_ads.tools.ads.resolve_customer_id", return_value="123")
+    def test_update_mask_paths(self, mock_resolve, mock_get_client, mock_get_service):
+        from google.ads.googleads.v23.services.types.ad_group_ad_service import AdGroupAdOperation
+
+        from mcp_google_ads.tools.ads import update_ad
+
+        mock_client = MagicMock()
+        operation = AdGroupAdOperation()
+        mock_client.get_type.return_value = operation
+        mock_get_client.return_value = mock_client
+
+        mock_service = MagicMock()
+        mock_service.mutate_ad_group_ads.return_value = _mock_mutate_response()
+        mock_get_service.return_value = mock_service
+
+        assert_success(update_ad("123", "222", "333", final_url="https://new.com", path1="p1"))
+        assert list(operation.update_mask.paths) == ["ad.final_urls", "ad.responsive_search_ad.path1"]
+        mock_client.copy_from.assert_not_called()
+
     @patch("mcp_google_ads.tools.ads.get_service")
     @patch("mcp_google_ads.tools.ads.get_client")
     @patch("mcp_google_ads.tools.ads.resolve_customer_id", return_value="123")
@@ -655,6 +714,7 @@ class TestUpdateAd:
 
         result = assert_error(update_ad("123", "222", "333"))
         assert "No fields to update" in result["error"]
+        mock_get_client.assert_not_called()
 
     @patch("mcp_google_ads.tools.ads.get_service")
     @patch("mcp_google_ads.tools.ads.get_client")
@@ -782,17 +842,10 @@ class TestGetAdStrength:
     def test_returns_ad_strength(self, mock_resolve, mock_get_service):
         from mcp_google_ads.tools.ads import get_ad_strength
 
-        mock_row = MagicMock()
-        mock_row.ad_group_ad.ad.id = 333
-        mock_row.ad_group_ad.ad_strength.name = "GOOD"
-        mock_row.ad_group_ad.status.name = "ENABLED"
-        mock_row.ad_group.id = 222
-        mock_row.ad_group.name = "Ad Group 1"
-        mock_row.campaign.id = 111
-        mock_row.campaign.name = "Campaign 1"
+        mock_row = _make_ad_row(ad_strength="GOOD")
 
         mock_service = MagicMock()
-        mock_service.search.return_value = [mock_row]
+        mock_service.search_stream.return_value = make_search_stream([mock_row])
         mock_get_service.return_value = mock_service
 
         result = assert_success(get_ad_strength("123"))
@@ -810,11 +863,11 @@ class TestGetAdStrength:
         from mcp_google_ads.tools.ads import get_ad_strength
 
         mock_service = MagicMock()
-        mock_service.search.return_value = []
+        mock_service.search_stream.return_value = []
         mock_get_service.return_value = mock_service
 
         assert_success(get_ad_strength("123", ad_group_id="222"))
-        query_called = mock_service.search.call_args[1]["query"]
+        query_called = mock_service.search_stream.call_args[1]["query"]
         assert "ad_group.id = 222" in query_called
 
     @patch("mcp_google_ads.tools.ads.get_service")
@@ -823,11 +876,11 @@ class TestGetAdStrength:
         from mcp_google_ads.tools.ads import get_ad_strength
 
         mock_service = MagicMock()
-        mock_service.search.return_value = []
+        mock_service.search_stream.return_value = []
         mock_get_service.return_value = mock_service
 
         assert_success(get_ad_strength("123", campaign_id="111"))
-        query_called = mock_service.search.call_args[1]["query"]
+        query_called = mock_service.search_stream.call_args[1]["query"]
         assert "campaign.id = 111" in query_called
 
     @patch("mcp_google_ads.tools.ads.get_service")
@@ -836,7 +889,7 @@ class TestGetAdStrength:
         from mcp_google_ads.tools.ads import get_ad_strength
 
         mock_service = MagicMock()
-        mock_service.search.return_value = []
+        mock_service.search_stream.return_value = []
         mock_get_service.return_value = mock_service
 
         result = assert_success(get_ad_strength("123"))
@@ -850,18 +903,10 @@ class TestGetAdStrength:
 
         rows = []
         for i, strength in enumerate(["POOR", "AVERAGE", "GOOD", "EXCELLENT"]):
-            row = MagicMock()
-            row.ad_group_ad.ad.id = 100 + i
-            row.ad_group_ad.ad_strength.name = strength
-            row.ad_group_ad.status.name = "ENABLED"
-            row.ad_group.id = 222
-            row.ad_group.name = "Group"
-            row.campaign.id = 111
-            row.campaign.name = "Campaign"
-            rows.append(row)
-
-        mock_service = MagicMock()
-        mock_service.search.return_value = rows
+            rows.append(_make_ad_row(ad_id=100 + i, ad_strength=strength, ad_group_name="Group", campaign_name="Campaign"))
+
+        mock_service = MagicMock()
+        mock_service.search_stream.return_value = make_search_stream(rows)
         mock_get_service.return_value = mock_service
 
         result = assert_success(get_ad_strength("123"))
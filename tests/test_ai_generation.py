@@ -80,6 +80,40 @@ class TestGenerateAdText:
         assert "Failed to generate ad text" in result["error"]
 
 
+    @patch("mcp_google_ads.tools.ai_generation._UNAVAILABLE_SERVICES", new_callable=set)
+    @patch("mcp_google_ads.tools.ai_generation.get_client")
+    @patch("mcp_google_ads.tools.ai_generation.resolve_customer_id", return_value="123")
+    def test_missing_service_is_remembered(self, mock_resolve, mock_client, unavailable):
+        from mcp_google_ads.tools.ai_generation import generate_ad_images, generate_ad_text
+
+        client = MagicMock()
+        mock_client.return_value = client
+        client.get_service.side_effect = ValueError("does not exist in Google Ads API v23")
+
+        first = assert_success(generate_ad_text("123", "https://example.com"))
+        second = assert_success(generate_ad_text("123", "https://example.com"))
+        images = assert_success(generate_ad_images("123", "https://example.com"))
+
+        assert first == second
+        assert "not available" in images["data"]["note"]
+        assert unavailable == {"AssetSuggestionService"}
+        client.get_service.assert_called_once_with("AssetSuggestionService")
+        client.get_type.assert_not_called()
+
+    @patch("mcp_google_ads.tools.ai_generation._UNAVAILABLE_SERVICES", new_callable=set)
+    @patch("mcp_google_ads.tools.ai_generation.get_client")
+    @patch("mcp_google_ads.tools.ai_generation.resolve_customer_id", return_value="123")
+    def test_transient_error_not_remembered(self, mock_resolve, mock_client, unavailable):
+        from mcp_google_ads.tools.ai_generation import generate_ad_text
+
+        client = MagicMock()
+        mock_client.return_value = client
+        client.get_service.side_effect = Exception("Service not found")
+
+        assert_success(generate_ad_text("123", "https://example.com"))
+        assert unavailable == set()
+
+
 class TestGenerateAdImages:
     @patch("mcp_google_ads.tools.ai_generation.get_client")
     @patch("mcp_google_ads.tools.ai_generation.resolve_customer_id", return_value="123")
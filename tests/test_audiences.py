@@ -4,7 +4,23 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-from tests.conftest import assert_error, assert_success
+from tests.conftest import assert_error, assert_success, make_google_ads_row, make_search_stream
+
+
+def _custom_audience_client():
+    """Client mock whose get_type returns a real CustomAudienceOperation.
+
+    create_custom_audience adds members on the underlying protobuf message,
+    which needs a genuine proto-plus operation and real member type enums.
+    """
+    from google.ads.googleads.v23.enums.types.custom_audience_member_type import CustomAudienceMemberTypeEnum
+    from google.ads.googleads.v23.services.types.custom_audience_service import CustomAudienceOperation
+
+    client = MagicMock()
+    client.enums.CustomAudienceTypeEnum.SEARCH = 3
+    client.enums.CustomAudienceMemberTypeEnum = CustomAudienceMemberTypeEnum.CustomAudienceMemberType
+    client.get_type.return_value = CustomAudienceOperation()
+    return client
 
 
 class TestListAudienceSegments:
@@ -55,20 +71,30 @@ class TestListCampaignTargeting:
     def test_returns_criteria(self, mock_resolve, mock_get_service):
         from mcp_google_ads.tools.audiences import list_campaign_targeting
 
-        mock_row = MagicMock()
-        mock_row.campaign_criterion.criterion_id = 555
-        mock_row.campaign_criterion.type_.name = "LOCATION"
-        mock_row.campaign_criterion.negative = False
-        mock_row.campaign_criterion.bid_modifier = 1.0
-        mock_row.campaign_criterion.status.name = "ENABLED"
+        row = make_google_ads_row({
+            "campaign_criterion": {
+                "criterion_id": 555,
+                "type": "LOCATION",
+                "negative": False,
+                "bid_modifier": 1.5,
+                "status": "ENABLED",
+            },
+        })
 
         mock_service = MagicMock()
-        mock_service.search.return_value = [mock_row]
+        mock_service.search_stream.return_value = make_search_stream([row])
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_campaign_targeting("123", "111"))
         assert result["data"]["count"] == 1
-        assert result["data"]["criteria"][0]["type"] == "LOCATION"
+        assert result["data"]["criteria"][0] == {
+            "criterion_id": "555",
+            "type": "LOCATION",
+            "negative": False,
+            "bid_modifier": 1.5,
+            "status": "ENABLED",
+        }
+        assert "campaign.id = 111" in mock_service.search_stream.call_args[1]["query"]
 
     def test_rejects_invalid_campaign_id(self):
         from mcp_google_ads.tools.audiences import list_campaign_targeting
@@ -132,6 +158,61 @@ class TestAddAudienceTargeting:
         assert "Failed to add audience targeting" in result["error"]
 
 
+class TestBulkAddAudienceTargeting:
+    @patch("mcp_google_ads.tools.audiences.get_service")
+    @patch("mcp_google_ads.tools.audiences.get_client")
+    @patch("mcp_google_ads.tools.audiences.resolve_customer_id", return_value="123")
+    def test_adds_in_single_call(self, mock_resolve, mock_get_client, mock_get_service, mock_google_ads_client):
+        from mcp_google_ads.tools.audiences import bulk_add_audience_targeting
+
+        mock_get_client.return_value = mock_google_ads_client
+        response = MagicMock()
+        response.results = [
+            MagicMock(resource_name="customers/123/campaignCriteria/111~1"),
+            MagicMock(resource_name="customers/123/campaignCriteria/333~2"),
+        ]
+        mock_service = MagicMock()
+        mock_service.mutate_campaign_criteria.return_value = response
+        mock_get_service.return_value = mock_service
+
+        result = assert_success(bulk_add_audience_targeting("123", [
+            {"campaign_id": "111", "audience_id": "222"},
+            {"campaign_id": "333", "audience_id": "222", "bid_modifier": 1.5},
+        ]))
+        assert result["data"]["added"] == 2
+        mock_service.mutate_campaign_criteria.assert_called_once()
+        operations = mock_service.mutate_campaign_criteria.call_args[1]["operations"]
+        assert [op.create.campaign for op in operations] == [
+            "customers/123/campaigns/111",
+            "customers/123/campaigns/333",
+        ]
+        assert operations[0].create.audience.audience == "customers/123/audiences/222"
+        assert operations[1].create.bid_modifier == 1.5
+
+    @patch("mcp_google_ads.tools.audiences.get_service")
+    @patch("mcp_google_ads.tools.audiences.get_client")
+    @patch("mcp_google_ads.tools.audiences.resolve_customer_id", return_value="123")
+    def test_invalid_id_sends_nothing(self, mock_resolve, mock_get_client, mock_get_service):
+        from mcp_google_ads.tools.audiences import bulk_add_audience_targeting
+
+        result = assert_error(bulk_add_audience_targeting("123", [
+            {"campaign_id": "111", "audience_id": "222"},
+            {"campaign_id": "111", "audience_id": "x/../1"},
+        ]))
+        assert "inválido" in result["error"]
+        mock_get_client.assert_not_called()
+        mock_get_service.return_value.mutate_campaign_criteria.assert_not_called()
+
+    @patch("mcp_google_ads.tools.audiences.resolve_customer_id", return_value="123")
+    def test_missing_field_and_empty_list(self, mock_resolve):
+        from mcp_google_ads.tools.audiences import bulk_add_audience_targeting
+
+        result = assert_error(bulk_add_audience_targeting("123", [{"campaign_id": "111"}]))
+        assert "missing required field 'audience_id'" in result["error"]
+        result = assert_error(bulk_add_audience_targeting("123", []))
+        assert "cannot be empty" in result["error"]
+
+
 class TestRemoveAudienceTargeting:
     @patch("mcp_google_ads.tools.audiences.get_service")
     @patch("mcp_google_ads.tools.audiences.get_client")
@@ -277,8 +358,7 @@ class TestCreateCustomAudience:
     def test_success(self, mock_resolve, mock_client, mock_get_service):
         from mcp_google_ads.tools.audiences import create_custom_audience
 
-        client = MagicMock()
-        mock_client.return_value = client
+        mock_client.return_value = _custom_audience_client()
         mock_response = MagicMock()
         mock_response.results = [MagicMock(resource_name="customers/123/customAudiences/999")]
         mock_service = MagicMock()
@@ -292,6 +372,29 @@ class TestCreateCustomAudience:
         assert result["data"]["audience_id"] == "999"
         assert "created" in result["message"]
 
+    @patch("mcp_google_ads.tools.audiences.get_service")
+    @patch("mcp_google_ads.tools.audiences.get_client")
+    @patch("mcp_google_ads.tools.audiences.resolve_customer_id", return_value="123")
+    def test_builds_members_on_operation(self, mock_resolve, mock_client, mock_get_service):
+        from mcp_google_ads.tools.audiences import create_custom_audience
+
+        client = _custom_audience_client()
+        operation = client.get_type.return_value
+        mock_client.return_value = client
+        mock_response = MagicMock()
+        mock_response.results = [MagicMock(resource_name="customers/123/customAudiences/999")]
+        mock_get_service.return_value.mutate_custom_audiences.return_value = mock_response
+
+        assert_success(create_custom_audience(
+            "123", "Test Audience", "SEARCH",
+            [{"type": "KEYWORD", "value": "test"}, {"type": "URL", "value": "https://example.com"}]
+        ))
+        members = operation.create.members
+        assert [(m.member_type.name, m.keyword, m.url) for m in members] == [
+            ("KEYWORD", "test", ""),
+            ("URL", "", "https://example.com"),
+        ]
+
     def test_invalid_type(self):
         from mcp_google_ads.tools.audiences import create_custom_audience
 
@@ -304,14 +407,14 @@ class TestCreateCustomAudience:
     def test_error(self, mock_resolve, mock_client, mock_get_service):
         from mcp_google_ads.tools.audiences import create_custom_audience
 
-        client = MagicMock()
-        mock_client.return_value = client
+        mock_client.return_value = _custom_audience_client()
         mock_service = MagicMock()
         mock_service.mutate_custom_audiences.side_effect = Exception("API error")
         mock_get_service.return_value = mock_service
 
         result = assert_error(create_custom_audience("123", "Test", "SEARCH", [{"type": "KEYWORD", "value": "t"}]))
         assert "Failed to create custom audience" in result["error"]
+        assert "API error" in result["error"]
 
 
 class TestAddAudienceSignal:
@@ -381,6 +484,8 @@ class TestAddSearchThemeSignal:
 
         result = assert_error(add_search_theme_signal("123", "456", ["t"] * 26))
         assert "Maximum 25" in result["error"]
+        mock_client.assert_not_called()
+        mock_get_service.assert_not_called()
 
     @patch("mcp_google_ads.tools.audiences.get_service")
     @patch("mcp_google_ads.tools.audiences.get_client")
@@ -404,33 +509,42 @@ class TestListAssetGroupSignals:
     def test_with_audience(self, mock_resolve, mock_get_service):
         from mcp_google_ads.tools.audiences import list_asset_group_signals
 
-        mock_row = MagicMock()
-        mock_row.asset_group_signal.resource_name = "customers/123/assetGroupSignals/456~1"
-        mock_row.asset_group_signal.approval_status.name = "APPROVED"
-        mock_row.asset_group_signal.audience.audience = "customers/123/audiences/789"
-        mock_row.asset_group_signal.search_theme.text = ""
+        row = make_google_ads_row({
+            "asset_group_signal": {
+                "resource_name": "customers/123/assetGroupSignals/456~1",
+                "approval_status": "APPROVED",
+                "audience": {"audience": "customers/123/audiences/789"},
+            },
+        })
 
         mock_service = MagicMock()
-        mock_service.search.return_value = [mock_row]
+        mock_service.search_stream.return_value = make_search_stream([row])
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_asset_group_signals("123", "456"))
         assert result["data"]["count"] == 1
-        assert result["data"]["signals"][0]["type"] == "audience"
+        assert result["data"]["signals"][0] == {
+            "resource_name": "customers/123/assetGroupSignals/456~1",
+            "approval_status": "APPROVED",
+            "type": "audience",
+            "audience": "customers/123/audiences/789",
+        }
 
     @patch("mcp_google_ads.tools.audiences.get_service")
     @patch("mcp_google_ads.tools.audiences.resolve_customer_id", return_value="123")
     def test_with_search_theme(self, mock_resolve, mock_get_service):
         from mcp_google_ads.tools.audiences import list_asset_group_signals
 
-        mock_row = MagicMock()
-        mock_row.asset_group_signal.resource_name = "customers/123/assetGroupSignals/456~2"
-        mock_row.asset_group_signal.approval_status.name = "APPROVED"
-        mock_row.asset_group_signal.audience.audience = ""
-        mock_row.asset_group_signal.search_theme.text = "web design"
+        row = make_google_ads_row({
+            "asset_group_signal": {
+                "resource_name": "customers/123/assetGroupSignals/456~2",
+                "approval_status": "APPROVED",
+                "search_theme": {"text": "web design"},
+            },
+        })
 
         mock_service = MagicMock()
-        mock_service.search.return_value = [mock_row]
+        mock_service.search_stream.return_value = make_search_stream([row])
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_asset_group_signals("123", "456"))
@@ -502,15 +616,18 @@ class TestListCustomAudiences:
     def test_returns_audiences(self, mock_resolve, mock_get_service):
         from mcp_google_ads.tools.audiences import list_custom_audiences
 
-        mock_row = MagicMock()
-        mock_row.custom_audience.id = 999
-        mock_row.custom_audience.name = "My Custom Audience"
-        mock_row.custom_audience.type_.name = "SEARCH"
-        mock_row.custom_audience.description = "Test desc"
-        mock_row.custom_audience.status.name = "ENABLED"
+        row = make_google_ads_row({
+            "custom_audience": {
+                "id": 999,
+                "name": "My Custom Audience",
+                "type": "SEARCH",
+                "description": "Test desc",
+                "status": "ENABLED",
+            },
+        })
 
         mock_service = MagicMock()
-        mock_service.search.return_value = [mock_row]
+        mock_service.search_stream.return_value = make_search_stream([row])
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_custom_audiences("123"))
@@ -518,6 +635,7 @@ class TestListCustomAudiences:
         assert result["data"]["audiences"][0]["name"] == "My Custom Audience"
         assert result["data"]["audiences"][0]["id"] == "999"
         assert result["data"]["audiences"][0]["type"] == "SEARCH"
+        assert result["data"]["audiences"][0]["status"] == "ENABLED"
 
     @patch("mcp_google_ads.tools.audiences.get_service")
     @patch("mcp_google_ads.tools.audiences.resolve_customer_id", return_value="123")
@@ -525,7 +643,7 @@ class TestListCustomAudiences:
         from mcp_google_ads.tools.audiences import list_custom_audiences
 
         mock_service = MagicMock()
-        mock_service.search.return_value = []
+        mock_service.search_stream.return_value = make_search_stream([])
         mock_get_service.return_value = mock_service
 
         result = assert_success(list_custom_audiences("123"))
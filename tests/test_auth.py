@@ -5,6 +5,7 @@ from __future__ import annotations
 from unittest.mock import MagicMock, patch
 
 import pytest
+from google.api_core.exceptions import ServiceUnavailable
 
 from mcp_google_ads.auth import get_client, get_service, reset_client
 
@@ -14,7 +15,7 @@ class TestGetClient:
         reset_client()
 
     @patch("mcp_google_ads.auth.load_config")
-    @patch("mcp_google_ads.auth.GoogleAdsClient.load_from_dict")
+    @patch("google.ads.googleads.client.GoogleAdsClient.load_from_dict")
     def test_creates_client_singleton(self, mock_load, mock_config):
         mock_config.return_value = MagicMock(
             client_id="id",
@@ -31,7 +32,7 @@ class TestGetClient:
         mock_load.assert_called_once()
 
     @patch("mcp_google_ads.auth.load_config")
-    @patch("mcp_google_ads.auth.GoogleAdsClient.load_from_dict")
+    @patch("google.ads.googleads.client.GoogleAdsClient.load_from_dict")
     def test_raises_on_auth_failure(self, mock_load, mock_config):
         mock_config.return_value = MagicMock()
         mock_load.side_effect = Exception("Auth failed")
@@ -41,6 +42,202 @@ class TestGetClient:
         with pytest.raises(AuthenticationError, match="Auth failed"):
             get_client()
 
+    @patch("mcp_google_ads.auth.time.sleep")
+    @patch("mcp_google_ads.auth.load_config")
+    @patch("google.ads.googleads.client.GoogleAdsClient.load_from_dict")
+    def test_non_retryable_error_fails_without_retry(self, mock_load, mock_config, mock_sleep):
+        from google.auth.exceptions import RefreshError
+
+        from mcp_google_ads.exceptions import AuthenticationError
+
+        mock_config.return_value = MagicMock()
+        mock_load.side_effect = RefreshError("invalid_grant")
+
+        with pytest.raises(AuthenticationError, match="invalid_grant"):
+            get_client()
+        mock_load.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch("mcp_google_ads.auth.time.sleep")
+    @patch("mcp_google_ads.auth.load_config")
+    @patch("google.ads.googleads.client.GoogleAdsClient.load_from_dict")
+    def test_retry_delay_uses_full_jitter(self, mock_load, mock_config, mock_sleep):
+        mock_config.return_value = MagicMock()
+        mock_load.side_effect = ServiceUnavailable("API down")
+
+        from mcp_google_ads.exceptions import AuthenticationError
+
+        with pytest.raises(AuthenticationError):
+            get_client()
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(delays) == 2
+        assert 0 <= delays[0] <= 1.0
+        assert 0 <= delays[1] <= 2.0
+
+
+class TestThreadSafety:
+    def setup_method(self):
+        reset_client()
+
+    @patch("mcp_google_ads.auth.load_config")
+    @patch("google.ads.googleads.client.GoogleAdsClient.load_from_dict")
+    def test_concurrent_first_calls_build_one_client(self, mock_load, mock_config):
+        import threading
+        import time
+
+        mock_config.return_value = MagicMock()
+
+        def slow_load(_):
+            time.sleep(0.05)
+            return MagicMock()
+
+        mock_load.side_effect = slow_load
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(get_client())) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        mock_load.assert_called_once()
+        assert len({id(c) for c in results}) == 1
+
+
+class TestCircuitBreaker:
+    def setup_method(self):
+        reset_client()
+
+    def teardown_method(self):
+        reset_client()
+
+    @patch("mcp_google_ads.auth.time.sleep")
+    @patch("mcp_google_ads.auth.load_config")
+    @patch("google.ads.googleads.client.GoogleAdsClient.load_from_dict")
+    def test_opens_after_threshold_and_fails_fast(self, mock_load, mock_config, mock_sleep):
+        from mcp_google_ads.auth import _CIRCUIT_FAILURE_THRESHOLD, _MAX_RETRIES
+        from mcp_google_ads.exceptions import AuthenticationError
+
+        mock_config.return_value = MagicMock()
+        mock_load.side_effect = ServiceUnavailable("API down")
+
+        for _ in range(_CIRCUIT_FAILURE_THRESHOLD):
+            with pytest.raises(AuthenticationError, match="API down"):
+                get_client()
+        assert mock_load.call_count == _CIRCUIT_FAILURE_THRESHOLD * _MAX_RETRIES
+
+        with pytest.raises(AuthenticationError, match="circuit open"):
+            get_client()
+        assert mock_load.call_count == _CIRCUIT_FAILURE_THRESHOLD * _MAX_RETRIES
+
+    @patch("mcp_google_ads.auth.time.monotonic")
+    @patch("mcp_google_ads.auth.time.sleep")
+    @patch("mcp_google_ads.auth.load_config")
+    @patch("google.ads.googleads.client.GoogleAdsClient.load_from_dict")
+    def test_half_open_probe_closes_on_success(self, mock_load, mock_config, mock_sleep, mock_monotonic):
+        from mcp_google_ads.auth import _CIRCUIT_FAILURE_THRESHOLD, _CIRCUIT_RESET_TIMEOUT, _breaker
+        from mcp_google_ads.exceptions import AuthenticationError
+
+        mock_config.return_value = MagicMock()
+        mock_monotonic.return_value = 1000.0
+        mock_load.side_effect = ServiceUnavailable("API down")
+        for _ in range(_CIRCUIT_FAILURE_THRESHOLD):
+            with pytest.raises(AuthenticationError):
+                get_client()
+        assert _breaker.state == "OPEN"
+
+        mock_monotonic.return_value = 1000.0 + _CIRCUIT_RESET_TIMEOUT
+        mock_load.side_effect = None
+        mock_load.return_value = MagicMock()
+
+        assert get_client() is mock_load.return_value
+        assert _breaker.state == "CLOSED"
+        assert _breaker.failures == 0
+
+
+class TestGetTypeCache:
+    def setup_method(self):
+        reset_client()
+
+    @patch("mcp_google_ads.auth.load_config")
+    @patch("google.ads.googleads.client.GoogleAdsClient.load_from_dict")
+    def test_resolves_type_once_and_returns_fresh_messages(self, mock_load, mock_config):
+        class FakeOperation:
+            pass
+
+        mock_config.return_value = MagicMock()
+        resolve = MagicMock(side_effect=lambda name: FakeOperation())
+        mock_load.return_value = MagicMock(get_type=resolve)
+
+        client = get_client()
+        first = client.get_type("AdGroupOperation")
+        second = client.get_type("AdGroupOperation")
+
+        assert isinstance(second, FakeOperation)
+        assert first is not second
+        resolve.assert_called_once_with("AdGroupOperation")
+
+
+class TestEnumCache:
+    def setup_method(self):
+        reset_client()
+
+    @patch("mcp_google_ads.auth.load_config")
+    @patch("google.ads.googleads.client.GoogleAdsClient.load_from_dict")
+    def test_resolves_enum_once(self, mock_load, mock_config):
+        class Enums:
+            lookups = 0
+
+            @property
+            def AdGroupStatusEnum(self):
+                Enums.lookups += 1
+                return MagicMock(PAUSED=3)
+
+        mock_config.return_value = MagicMock()
+        mock_load.return_value = MagicMock(enums=Enums())
+
+        client = get_client()
+        assert client.enums.AdGroupStatusEnum.PAUSED == 3
+        assert client.enums.AdGroupStatusEnum.PAUSED == 3
+        assert Enums.lookups == 1
+
+    def test_unknown_enum_raises_attribute_error(self):
+        from mcp_google_ads.auth import _CachedEnums
+
+        enums = _CachedEnums(object())
+        with pytest.raises(AttributeError):
+            _ = enums.NotAnEnum
+
+
+class TestProtobufBackendCheck:
+    @patch("google.protobuf.internal.api_implementation.Type", return_value="python")
+    def test_warns_on_pure_python_backend(self, mock_type, caplog):
+        from mcp_google_ads.auth import _warn_if_pure_python_protobuf
+
+        with caplog.at_level("WARNING", logger="mcp_google_ads.auth"):
+            _warn_if_pure_python_protobuf()
+        assert "pure-Python backend" in caplog.text
+
+    @patch("google.protobuf.internal.api_implementation.Type", return_value="upb")
+    def test_silent_on_native_backend(self, mock_type, caplog):
+        from mcp_google_ads.auth import _warn_if_pure_python_protobuf
+
+        with caplog.at_level("WARNING", logger="mcp_google_ads.auth"):
+            _warn_if_pure_python_protobuf()
+        assert caplog.text == ""
+
+
+class TestLazyImport:
+    def test_auth_import_does_not_load_google_ads(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, mcp_google_ads.auth; "
+            "sys.exit(1 if 'google.ads.googleads.client' in sys.modules else 0)"
+        )
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
 
 class TestResetClient:
     def test_resets_singleton(self):
@@ -48,6 +245,12 @@ class TestResetClient:
 
 
 class TestGetService:
+    def setup_method(self):
+        reset_client()
+
+    def teardown_method(self):
+        reset_client()
+
     @patch("mcp_google_ads.auth.get_client")
     def test_gets_service(self, mock_get_client):
         mock_client = MagicMock()
@@ -55,3 +258,17 @@ class TestGetService:
 
         get_service("GoogleAdsService")
         mock_client.get_service.assert_called_once_with("GoogleAdsService")
+
+    @patch("mcp_google_ads.auth.get_client")
+    def test_service_cached_per_name(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client.get_service.side_effect = lambda name: MagicMock(name=name)
+        mock_get_client.return_value = mock_client
+
+        first = get_service("GoogleAdsService")
+        assert get_service("GoogleAdsService") is first
+        assert get_service("CampaignService") is not first
+        assert mock_client.get_service.call_count == 2
+
+        reset_client()
+        assert get_service("GoogleAdsService") is not first
@@ -28,6 +28,36 @@ def _mock_mutate_response(resource_types):
 
 
 class TestBatchSetStatus:
+    @patch("mcp_google_ads.tools.batch.get_service")
+    @patch("mcp_google_ads.tools.batch.get_client")
+    @patch("mcp_google_ads.tools.batch.resolve_customer_id", return_value="123")
+    def test_builds_operations_in_place(self, mock_resolve, mock_client, mock_get_service):
+        from google.ads.googleads.v23.services.types.google_ads_service import MutateOperation
+
+        from mcp_google_ads.tools.batch import batch_set_status
+
+        client = MagicMock()
+        client.enums.CampaignStatusEnum.PAUSED = 3
+        client.enums.AdGroupAdStatusEnum.PAUSED = 3
+        client.get_type.side_effect = lambda name: MutateOperation()
+        mock_client.return_value = client
+        mock_service = MagicMock()
+        mock_service.mutate.return_value = _mock_mutate_response(["campaign", "ad"])
+        mock_get_service.return_value = mock_service
+
+        resources = [
+            {"type": "campaign", "id": "111"},
+            {"type": "ad", "id": "333", "ad_group_id": "222"},
+        ]
+        assert_success(batch_set_status("123", resources, "PAUSED"))
+
+        campaign_op, ad_op = mock_service.mutate.call_args[1]["mutate_operations"]
+        assert campaign_op.campaign_operation.update.resource_name == "customers/123/campaigns/111"
+        assert list(campaign_op.campaign_operation.update_mask.paths) == ["status"]
+        assert ad_op.ad_group_ad_operation.update.resource_name == "customers/123/adGroupAds/222~333"
+        assert list(ad_op.ad_group_ad_operation.update_mask.paths) == ["status"]
+        client.copy_from.assert_not_called()
+
     @patch("mcp_google_ads.tools.batch.get_service")
     @patch("mcp_google_ads.tools.batch.get_client")
     @patch("mcp_google_ads.tools.batch.resolve_customer_id", return_value="123")
@@ -456,7 +456,9 @@ class TestUpdateBiddingStrategy:
         assert operation.update.name == "Updated"
         assert operation.update.target_roas.target_roas == 4.0
         assert operation.update.target_spend.cpc_bid_ceiling_micros == 1_000_000
-        client.copy_from.assert_called_once()
+        operation.update_mask.paths.extend.assert_called_once_with(
+            ["name", "target_roas.target_roas", "target_spend.cpc_bid_ceiling_micros"]
+        )
 
     @patch("mcp_google_ads.tools.bidding.get_service")
     @patch("mcp_google_ads.tools.bidding.get_client")
@@ -499,7 +501,7 @@ class TestSetCampaignBiddingStrategy:
         operation = client.get_type.return_value
         assert operation.update.resource_name == "customers/123/campaigns/555"
         assert operation.update.bidding_strategy == "customers/123/biddingStrategies/999"
-        client.copy_from.assert_called_once()
+        operation.update_mask.paths.append.assert_called_once_with("bidding_strategy")
         mock_service.mutate_campaigns.assert_called_once()
 
     @patch("mcp_google_ads.tools.bidding.get_service")
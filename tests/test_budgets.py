@@ -522,8 +522,8 @@ class TestUpdateBudget:
 
         update_budget("123", "555", amount=50.0, name="Test")
 
-        # copy_from deve ter sido chamado com o field mask
-        assert client.copy_from.called
+        operation = client.get_type.return_value
+        operation.update_mask.paths.extend.assert_called_once_with(["amount_micros", "name"])
 
 
 class TestRemoveBudget:
@@ -57,7 +57,29 @@ class TestGoogleAdsConfig:
             config.client_id = "new"  # type: ignore[misc]
 
 
+class TestFromEnv:
+    @patch.dict(os.environ, {
+        "GOOGLE_ADS_CLIENT_ID": "env-id",
+        "GOOGLE_ADS_CUSTOMER_ID": "111-222-3333",
+    }, clear=True)
+    def test_reads_env_with_empty_defaults(self):
+        config = GoogleAdsConfig.from_env()
+        assert config.client_id == "env-id"
+        assert config.default_customer_id == "111-222-3333"
+        assert config.developer_token == ""
+
+    def test_required_fields_have_no_defaults(self):
+        with pytest.raises(TypeError):
+            GoogleAdsConfig()  # type: ignore[call-arg]
+
+
 class TestLoadConfig:
+    def setup_method(self):
+        load_config.cache_clear()
+
+    def teardown_method(self):
+        load_config.cache_clear()
+
     @patch.dict(os.environ, {
         "GOOGLE_ADS_CLIENT_ID": "test-id",
         "GOOGLE_ADS_CLIENT_SECRET": "test-secret",
@@ -74,3 +96,18 @@ class TestLoadConfig:
     def test_raises_on_missing(self):
         with pytest.raises(EnvironmentError, match="Missing required"):
             load_config()
+
+    @patch.dict(os.environ, {
+        "GOOGLE_ADS_CLIENT_ID": "test-id",
+        "GOOGLE_ADS_CLIENT_SECRET": "test-secret",
+        "GOOGLE_ADS_DEVELOPER_TOKEN": "test-token",
+        "GOOGLE_ADS_REFRESH_TOKEN": "test-refresh",
+        "GOOGLE_ADS_LOGIN_CUSTOMER_ID": "123456",
+    })
+    def test_cached_between_calls(self):
+        first = load_config()
+        os.environ["GOOGLE_ADS_CLIENT_ID"] = "changed"
+        assert load_config() is first
+
+        load_config.cache_clear()
+        assert load_config().client_id == "changed"
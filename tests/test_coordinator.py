@@ -0,0 +1,23 @@
+"""Tests for coordinator.py."""
+
+from __future__ import annotations
+
+import asyncio
+
+from mcp_google_ads.coordinator import load_tool_catalog, mcp
+
+
+class TestToolCatalog:
+    def test_catalog_lists_every_module(self):
+        catalog = load_tool_catalog()
+        assert "## Tool Categories" in catalog
+        assert "**Ad Groups (8):**" in catalog
+        assert "**Smart Campaigns (4):**" in catalog
+
+    def test_instructions_point_to_catalog_resource(self):
+        assert "google-ads://tool-catalog" in mcp.instructions
+        assert "## Tool Categories" not in mcp.instructions
+
+    def test_catalog_served_as_resource(self):
+        contents = asyncio.run(mcp.read_resource("google-ads://tool-catalog"))
+        assert "## Tool Categories" in list(contents)[0].content
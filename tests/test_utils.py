@@ -9,10 +9,13 @@ import pytest
 
 from mcp_google_ads.utils import (
     build_date_clause,
+    enum_name,
     error_response,
     format_micros,
     proto_to_dict,
     resolve_customer_id,
+    search_stream_rows,
+    select_fields,
     success_response,
     to_micros,
     validate_date,
@@ -43,6 +46,25 @@ class TestResolveCustomerId:
             resolve_customer_id(None)
 
 
+class TestSelectFields:
+    _MAP = {"id": "ad_group.id", "name": "ad_group.name", "bid": "ad_group.cpc_bid_micros",
+            "bid_micros": "ad_group.cpc_bid_micros"}
+
+    def test_default_selects_all_columns(self):
+        keys, select = select_fields(None, self._MAP)
+        assert keys == ("id", "name", "bid", "bid_micros")
+        assert select == "ad_group.id, ad_group.name, ad_group.cpc_bid_micros"
+
+    def test_subset_keeps_required_columns(self):
+        keys, select = select_fields(["bid"], self._MAP, required=("ad_group.id",))
+        assert keys == ("bid",)
+        assert select == "ad_group.id, ad_group.cpc_bid_micros"
+
+    def test_rejects_unknown_field(self):
+        with pytest.raises(Exception, match="Campos inválidos"):
+            select_fields(["name", "metrics.cost_micros"], self._MAP)
+
+
 class TestSuccessResponse:
     def test_basic_success(self):
         result = json.loads(success_response({"key": "value"}))
@@ -57,6 +79,15 @@ class TestSuccessResponse:
         result = json.loads(success_response({"a": 1}))
         assert "message" not in result
 
+    def test_keeps_unicode_and_stringifies_unknown_types(self):
+        from decimal import Decimal
+
+        raw = success_response({"name": "Promoção", "amount": Decimal("1.50"), 7: "int key"})
+        assert "Promoção" in raw
+        result = json.loads(raw)
+        assert result["data"]["amount"] == "1.50"
+        assert result["data"]["7"] == "int key"
+
 
 class TestErrorResponse:
     def test_basic_error(self):
@@ -129,6 +160,10 @@ class TestValidateDate:
         with pytest.raises(Exception, match="Data inválida"):
             validate_date("2024/01/15")
 
+    def test_rejects_trailing_newline(self):
+        with pytest.raises(Exception, match="Data inválida"):
+            validate_date("2024-01-15\n")
+
 
 class TestValidateNumericId:
     def test_valid_id(self):
@@ -141,6 +176,20 @@ class TestValidateNumericId:
         with pytest.raises(Exception, match="inválido"):
             validate_numeric_id("abc123")
 
+    def test_cached_result_and_errors_not_cached(self):
+        validate_numeric_id.cache_clear()
+        validate_numeric_id("555")
+        validate_numeric_id("555")
+        assert validate_numeric_id.cache_info().hits == 1
+        for _ in range(2):
+            with pytest.raises(Exception, match="inválido"):
+                validate_numeric_id("x55")
+
+    def test_rejects_trailing_newline_and_non_ascii_digits(self):
+        for value in ("123\n", "\u0661\u0662\u0663"):
+            with pytest.raises(Exception, match="inválido"):
+                validate_numeric_id(value)
+
 
 class TestBuildDateClause:
     def test_with_start_end(self):
@@ -193,6 +242,10 @@ class TestValidateEnumValue:
         with pytest.raises(Exception, match="inválido"):
             validate_enum_value("")
 
+    def test_rejects_trailing_newline(self):
+        with pytest.raises(Exception, match="inválido"):
+            validate_enum_value("ENABLED\n")
+
 
 class TestValidateLimit:
     def test_valid_limit(self):
@@ -264,6 +317,38 @@ class TestProtoToDict:
         assert result == {"raw": "BadObject(data=123)"}
 
 
+class TestEnumName:
+    def test_unknown_enum_number_falls_back_to_str(self):
+        from tests.conftest import make_google_ads_row
+        raw = type(make_google_ads_row({})).pb(make_google_ads_row({}))
+        raw.ad_group.status = 999
+        assert enum_name(raw.ad_group, "status") == "999"
+
+    def test_enum_table_built_once_per_field(self):
+        from mcp_google_ads.utils import _enum_names
+        from tests.conftest import make_google_ads_row
+        raw = type(make_google_ads_row({})).pb(make_google_ads_row({"ad_group": {"status": "ENABLED"}}))
+        _enum_names.cache_clear()
+        for _ in range(3):
+            assert enum_name(raw.ad_group, "status") == "ENABLED"
+        assert _enum_names.cache_info().misses == 1
+
+
+class TestSearchStreamRows:
+    def test_flattens_batches_into_raw_rows(self):
+        from tests.conftest import make_google_ads_row, make_search_stream
+        batches = make_search_stream([make_google_ads_row({"campaign": {"id": 1}})]) + make_search_stream(
+            [make_google_ads_row({"campaign": {"id": 2}}), make_google_ads_row({"campaign": {"id": 3}})]
+        )
+        service = MagicMock()
+        service.search_stream.return_value = batches
+
+        rows = list(search_stream_rows(service, "123", "SELECT campaign.id FROM campaign"))
+        assert [r.campaign.id for r in rows] == [1, 2, 3]
+        assert not hasattr(rows[0], "_pb")
+        service.search_stream.assert_called_once_with(customer_id="123", query="SELECT campaign.id FROM campaign")
+
+
 class TestValidateBatch:
     def test_valid_batch(self):
         from mcp_google_ads.utils import validate_batch
@@ -342,3 +427,19 @@ class TestGetFriendlyError:
         from mcp_google_ads.exceptions import get_friendly_error
         result = get_friendly_error("COMPLETELY_UNKNOWN")
         assert result == "COMPLETELY_UNKNOWN"
+
+    def test_case_insensitive_match(self):
+        from mcp_google_ads.exceptions import get_friendly_error
+        result = get_friendly_error("keyword_error")
+        assert "keyword" in result.lower()
+
+    def test_dict_order_wins_when_multiple_codes_match(self):
+        from mcp_google_ads.exceptions import FRIENDLY_ERROR_MESSAGES, get_friendly_error
+        result = get_friendly_error("KEYWORD_ERROR", "AUTHENTICATION_ERROR while mutating")
+        assert result.startswith(FRIENDLY_ERROR_MESSAGES["AUTHENTICATION_ERROR"])
+
+    def test_friendly_messages_are_read_only(self):
+        from mcp_google_ads.exceptions import FRIENDLY_ERROR_MESSAGES
+        with pytest.raises(TypeError):
+            FRIENDLY_ERROR_MESSAGES["NEW_ERROR"] = "x"  # type: ignore[index]
+        assert all(key == key.upper() for key in FRIENDLY_ERROR_MESSAGES)